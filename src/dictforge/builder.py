@@ -3,7 +3,6 @@ import json
 import re
 import shutil
 import sys
-from collections import OrderedDict
 from collections.abc import Iterable
 from functools import partial
 from pathlib import Path
@@ -12,6 +11,7 @@ from typing import Any
 import requests
 from rich.console import Console
 
+from . import jsonl
 from .export_base import ExportFormat
 from .export_mobi import MobiExportFormat
 from .export_stardict import StarDictExportFormat
@@ -23,6 +23,8 @@ from .source_base import DictionarySource
 from .source_freedict import FreeDictSource
 from .source_kaikki import KaikkiDownloadError, KaikkiParseError, KaikkiSource
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
 
 def get_available_formats() -> dict[str, type[ExportFormat]]:
     """Return a dictionary of available export format classes."""
@@ -97,7 +99,7 @@ class Builder:
         filename = f"{self._slugify(in_lang)}__{self._slugify(out_lang)}__{source_tag_slug}.jsonl"
         combined_path = combined_dir / filename
 
-        merged_entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        merged_entries: dict[str, dict[str, Any]] = {}
         entry_sources: dict[str, list[str]] = {}  # Track which sources contributed to each entry
 
         for source in self._sources:
@@ -105,13 +107,13 @@ class Builder:
             data_path, _ = source.get_entries(in_lang, out_lang)
             source.log_filter_stats(in_lang, self._console)
             try:
-                with data_path.open("r", encoding="utf-8") as fh:
+                with data_path.open("rb") as fh:
                     for line in fh:
                         payload = line.strip()
                         if not payload:
                             continue
                         try:
-                            entry = json.loads(payload)
+                            entry = jsonl.loads(payload)
                         except json.JSONDecodeError as exc:
                             raise KaikkiParseError(data_path, exc) from exc
                         if not source.entry_has_content(entry):
@@ -142,12 +144,12 @@ class Builder:
                 f"No entries produced by configured sources for {in_lang} → {out_lang}.",
             )
 
-        with combined_path.open("w", encoding="utf-8") as dst:
+        with combined_path.open("wb") as dst:
             for entry in merged_entries.values():
                 # Ensure entry has required 'pos' field (some sources may not provide it)
                 if "pos" not in entry:
                     entry["pos"] = "noun"  # Default POS when not provided
-                dst.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                dst.write(jsonl.dumps_line(entry))
 
         return combined_path, len(merged_entries)
 
@@ -213,10 +215,11 @@ class Builder:
             target_examples = []
             target_sense["examples"] = target_examples
 
+        append = target_examples.append
         for example in incoming_examples:
-            exemplar = copy.deepcopy(example)
-            if exemplar not in target_examples:
-                target_examples.append(exemplar)
+            # A deep copy compares equal to its source, so only copy examples we keep.
+            if example not in target_examples:
+                append(copy.deepcopy(example))
 
     def ensure_download_dirs(self, force: bool = False) -> None:  # noqa: ARG002
         """Delegate download preparation to each configured source."""
@@ -228,7 +231,7 @@ class Builder:
 
     def _slugify(self, value: str) -> str:
         """Return a filesystem-friendly slug used for cache file names."""
-        return re.sub(r"[^A-Za-z0-9]+", "_", value.strip()) or "language"
+        return _SLUG_RE.sub("_", value.strip()) or "language"
 
     def _create_export_format(self, format_name: str) -> ExportFormat:
         """Create an export format instance by name."""
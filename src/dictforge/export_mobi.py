@@ -22,6 +22,8 @@ from .progress_bar import (
 )
 from .source_kaikki import KaikkiParseError
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
 
 class MobiExportFormat(ExportFormat):
     """
@@ -141,7 +143,7 @@ class MobiExportFormat(ExportFormat):
 
     def _slugify(self, value: str) -> str:
         """Return a filesystem-friendly slug."""
-        return re.sub(r"[^A-Za-z0-9]+", "_", value.strip()) or "language"
+        return _SLUG_RE.sub("_", value.strip()) or "language"
 
     def _emit_creator_output(self, label: str, capture: _BaseProgressCapture) -> None:
         """Dump captured stdout/stderr with a friendly heading."""
@@ -241,7 +243,11 @@ class MobiExportFormat(ExportFormat):
             ) from fallback_exc
 
         final_path = Path(f"{mobi_base}.mobi")
-        shutil.move(mobi_path, final_path)
+        try:
+            # Same output directory: rename in place, also overwriting a previous build.
+            mobi_path.replace(final_path)
+        except OSError:
+            shutil.move(mobi_path, final_path)
         dc.mobi_path = str(final_path)
         shutil.rmtree(mobi_base, ignore_errors=True)
 
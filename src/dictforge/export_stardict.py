@@ -10,8 +10,11 @@ from typing import Any
 
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn, TimeRemainingColumn
 
+from . import jsonl
 from .export_base import ExportFormat
 
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+
 
 class StarDictExportFormat(ExportFormat):
     """
@@ -119,7 +122,14 @@ class StarDictExportFormat(ExportFormat):
 
     def _slugify(self, value: str) -> str:
         """Return a filesystem-friendly slug."""
-        return re.sub(r"[^A-Za-z0-9]+", "_", value.strip()) or "dictionary"
+        return _SLUG_RE.sub("_", value.strip()) or "dictionary"
+
+    def _progress(self, *, with_eta: bool = True) -> Progress:
+        """Create a progress display with the exporter's console and progress setting."""
+        columns: list[Any] = [TextColumn("[progress.description]{task.description}"), BarColumn()]
+        if with_eta:
+            columns.extend([TaskProgressColumn(), TimeRemainingColumn()])
+        return Progress(*columns, console=self._console, disable=not self._show_progress)
 
     def _build_dictionary_files(
         self,
@@ -138,25 +148,18 @@ class StarDictExportFormat(ExportFormat):
         # Collect all entries first, sorting by word (case-sensitive)
         entries: list[tuple[str, str]] = []
 
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=self._console,
-            disable=not self._show_progress,
-        ) as progress:
+        with self._progress() as progress:
             # Read and parse entries
             read_task = progress.add_task("Reading entries...", total=entry_count)
 
-            with entries_file.open("r", encoding="utf-8") as fh:
+            with entries_file.open("rb") as fh:
                 for raw_line in fh:
                     line_content = raw_line.strip()
                     if not line_content:
                         continue
 
                     try:
-                        entry = json.loads(line_content)
+                        entry = jsonl.loads(line_content)
                     except json.JSONDecodeError:
                         continue
 
@@ -175,14 +178,7 @@ class StarDictExportFormat(ExportFormat):
         entries.sort(key=lambda x: x[0].lower())
 
         # Build index and data files
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=self._console,
-            disable=not self._show_progress,
-        ) as progress:
+        with self._progress() as progress:
             write_task = progress.add_task("Writing dictionary...", total=len(entries))
 
             with (
@@ -354,12 +350,7 @@ class StarDictExportFormat(ExportFormat):
         works for most StarDict readers. For full dictzip support, consider
         using the dictzip tool.
         """
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=self._console,
-            disable=not self._show_progress,
-        ) as progress:
+        with self._progress(with_eta=False) as progress:
             progress.add_task("Compressing dictionary...", total=None)
 
             with (
@@ -0,0 +1,27 @@
+"""JSON Lines helpers that use orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # optional speed-up, stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse one JSON document; raises ``json.JSONDecodeError`` on invalid input.
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError`` so callers only
+    need to handle the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialise ``obj`` as a UTF-8 encoded JSON line (with trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
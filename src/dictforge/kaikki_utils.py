@@ -43,11 +43,14 @@ FREEDICT_ISO_CODES = {
 }
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def normalize_input_name(name: str) -> str:
     """Collapse user input aliases to canonical Kaikki language names."""
     if not name:
         return name
-    key = re.sub(r"\s+", " ", name.strip().lower())
+    key = _WHITESPACE_RE.sub(" ", name.strip().lower())
     return ALIASES.get(key, name.strip())
 
 
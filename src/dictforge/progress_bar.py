@@ -1,7 +1,9 @@
 import io
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager
-from typing import Any
+from time import monotonic
+from typing import Any, ClassVar
 
 from rich.console import Console
 from rich.progress import (
@@ -9,7 +11,6 @@ from rich.progress import (
     DownloadColumn,
     Progress,
     SpinnerColumn,
-    Task,
     TextColumn,
     TimeElapsedColumn,
     TimeRemainingColumn,
@@ -17,19 +18,14 @@ from rich.progress import (
 )
 
 
-def _format_units(task: Task, unit: str) -> str:
-    """Present rich-progress counts with human-friendly thousands separators."""
-    completed = int(task.completed or 0)
-    total = task.total
-    label = unit if unit != "B" else "B"
-    if total is None:
-        return f"{completed:,} {label}"
-    return f"{completed:,}/{int(total):,} {label}"
-
-
 class _BaseProgressCapture(io.TextIOBase):
     """Mirror stdout/stderr into a Rich task while collecting diagnostic text."""
 
+    # Rich redraws a few times per second, so denser counter updates are coalesced.
+    _UPDATE_INTERVAL = 0.1
+    # Only the most recent unrecognised lines are kept; the full text stays in output().
+    _MAX_WARNINGS = 1024
+
     def __init__(
         self,
         *,
@@ -45,13 +41,19 @@ class _BaseProgressCapture(io.TextIOBase):
         self._enabled = enabled
         self._description = description
         self._unit = unit
+        self._unit_hint = f" [{unit}]" if unit else ""
         self._total_hint = total_hint
         self._progress: Progress | None = None
         self._task_id: int | None = None
-        self._captured = io.StringIO()
-        self._buffer = ""
+        # True while the Rich task exists, i.e. between start() and stop().
+        self._active = False
+        self._captured: list[str] = []
+        self._buffer_parts: list[str] = []
         self._current = 0
-        self._warnings: list[str] = []
+        self._last_update = 0.0
+        # True when _current holds a throttled value the Rich task has not seen yet.
+        self._pending = False
+        self._warnings: deque[str] = deque(maxlen=self._MAX_WARNINGS)
 
     def writable(self) -> bool:  # pragma: no cover - standard TextIO contract
         """Signal compatibility with file-like write operations."""
@@ -59,8 +61,7 @@ class _BaseProgressCapture(io.TextIOBase):
 
     def _format_description(self, text: str) -> str:
         """Append unit information to ``text`` for nicer progress labels."""
-        unit_hint = f" [{self._unit}]" if self._unit else ""
-        return f"{text}{unit_hint}"
+        return text + self._unit_hint
 
     def start(self) -> None:
         """Create the Rich progress task if progress output is enabled."""
@@ -86,25 +87,46 @@ class _BaseProgressCapture(io.TextIOBase):
             self._format_description(self._description),
             total=self._total_hint,
         )
+        self._active = True
+
+    def _flush_partial_line(self) -> None:
+        """Dispatch any buffered text that was not terminated by a newline."""
+        pending = "".join(self._buffer_parts).strip()
+        self._buffer_parts.clear()
+        if pending:
+            self.handle_line(pending)
 
     def stop(self) -> None:
         """Flush buffered text and tear down the Rich progress context."""
-        if self._buffer.strip():
-            self.handle_line(self._buffer.strip())
-        self._buffer = ""
-        if self._progress is not None and self._task_id is not None:
-            self._progress.__exit__(None, None, None)
+        self._flush_partial_line()
+        self._flush_pending()
+        if self._active:
+            self._active = False
+            self._progress.__exit__(None, None, None)  # type: ignore
             self._progress = None
 
     def write(self, text: str) -> int:
         """Buffer ``text`` and dispatch whole lines to :meth:`handle_line`."""
-        self._captured.write(text)
-        self._buffer += text
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
-            self.handle_line(line.strip())
+        self._captured.append(text)
+        self._buffer_parts.append(text)
+        if "\n" not in text:
+            # Partial line: keep the chunk and defer joining until a newline arrives.
+            return len(text)
+        *lines, tail = "".join(self._buffer_parts).split("\n")
+        self._buffer_parts.clear()
+        if tail:
+            self._buffer_parts.append(tail)
+        for line in lines:
+            # strip() returns the line itself when there is nothing to trim.
+            stripped = line.strip()
+            if stripped:
+                self.handle_line(stripped)
         return len(text)
 
+    def writelines(self, lines: Iterable[str]) -> None:
+        """Write all ``lines`` through a single :meth:`write` call."""
+        self.write("".join(lines))
+
     def flush(self) -> None:  # pragma: no cover - interface requirement
         """Satisfy the file-like interface expected by ``redirect_stdout``."""
         return
@@ -116,10 +138,10 @@ class _BaseProgressCapture(io.TextIOBase):
 
     def set_total(self, total: int) -> None:
         """Switch the task into determinate mode when ``total`` becomes known."""
-        if total < 0:
+        if total < 0 or total == self._total_hint:
             return
         self._total_hint = total
-        if self._progress is not None and self._task_id is not None:
+        if self._active:
             self._progress.update(self._task_id, total=total)  # type: ignore
 
     def advance_to(self, value: int) -> None:
@@ -127,13 +149,30 @@ class _BaseProgressCapture(io.TextIOBase):
         if value <= self._current:
             return
         self._current = value
-        if self._progress is not None and self._task_id is not None:
+        if not self._active:
+            return
+        now = monotonic()
+        if value == self._total_hint or now - self._last_update >= self._UPDATE_INTERVAL:
+            self._last_update = now
+            self._pending = False
             self._progress.update(self._task_id, completed=value)  # type: ignore
+        else:
+            self._pending = True
+
+    def _flush_pending(self) -> None:
+        """Show the last throttled counter value, e.g. before a phase change or a long pause."""
+        if self._pending and self._active:
+            self._pending = False
+            self._last_update = monotonic()
+            self._progress.update(self._task_id, completed=self._current)  # type: ignore
 
     def set_description(self, description: str) -> None:
         """Update the text displayed alongside the progress indicator."""
+        if description == self._description:
+            return
+        self._flush_pending()
         self._description = description
-        if self._progress is not None and self._task_id is not None:
+        if self._active:
             self._progress.update(
                 self._task_id,  # type: ignore
                 description=self._format_description(description),
@@ -141,31 +180,28 @@ class _BaseProgressCapture(io.TextIOBase):
 
     def finish(self) -> None:
         """Ensure the task reaches completion once the wrapped job ends."""
-        if self._progress is not None and self._task_id is not None:
+        self._pending = False
+        if self._active:
             completed = self._total_hint if self._total_hint is not None else self._current
             self._progress.update(self._task_id, completed=completed)  # type: ignore
 
     @property
     def warnings(self) -> list[str]:
-        """Warnings captured from the underlying tool's stdout/stderr."""
-        return self._warnings
+        """Warnings captured from the underlying tool's stdout/stderr (most recent last)."""
+        return list(self._warnings)
 
     def output(self) -> str:
         """Return the raw captured output (including buffered partial lines)."""
-        if self._buffer.strip():
-            self.handle_line(self._buffer.strip())
-            self._buffer = ""
-        return self._captured.getvalue()
+        self._flush_partial_line()
+        return "".join(self._captured)
 
     @staticmethod
     def _extract_number_prefix(line: str, suffix: str) -> int | None:
         """Extract number from line prefix before given suffix, or None if invalid."""
         if not line.endswith(suffix):
             return None
-        try:
-            return int(line.split(" ", 1)[0])
-        except ValueError:
-            return None
+        head = line.partition(" ")[0]
+        return int(head) if head.isdecimal() else None
 
 
 class _DatabaseProgressCapture(_BaseProgressCapture):
@@ -200,7 +236,7 @@ class _DatabaseProgressCapture(_BaseProgressCapture):
             self.set_description("Linking inflections")
             return
 
-        self.warnings.append(line)
+        self._warnings.append(line)
 
 
 class _KindleProgressCapture(_BaseProgressCapture):
@@ -223,65 +259,57 @@ class _KindleProgressCapture(_BaseProgressCapture):
         self.base_forms: int | None = None
         self.inflections: int | None = None
 
-    def _handle_description_update(self, line: str, exact_match: str, description: str) -> bool:
-        """Update description if line exactly matches given string."""
-        if line == exact_match:
-            self.set_description(description)
-            return True
-        return False
-
-    def _handle_words_progress(self, line: str) -> bool:
-        """Handle lines ending with ' words' and update progress accordingly."""
-        words = self._extract_number_prefix(line, " words")
-        if words is None:
-            return False
+    _DESCRIPTIONS: ClassVar[dict[str, str]] = {
+        "Getting base forms": "Loading base forms",
+        "Creating dictionary": "Compiling dictionary",
+        "Writing dictionary": "Writing MOBI file",
+    }
+
+    def _on_words(self, words: int) -> None:
+        """Advance progress from a ``N words`` line."""
         if self._total_hint is None:
             self.set_total(self.base_forms if self.base_forms is not None else words)
         self.advance_to(words)
-        return True
 
-    def handle_line(self, line: str) -> None:  # noqa: C901,PLR0911
+    def _on_base_forms(self, base_forms: int) -> None:
+        """Record the base form count, which is also the progress total."""
+        self.base_forms = base_forms
+        self.set_total(base_forms)
+        self.advance_to(base_forms)
+
+    def _on_inflections(self, inflections: int) -> None:
+        """Record the inflection count reported by the tool."""
+        self.inflections = inflections
+
+    # Counter lines are matched by suffix; a matching line with an invalid number is ignored.
+    _COUNTERS: ClassVar[tuple[tuple[str, Callable[["_KindleProgressCapture", int], None]], ...]] = (
+        (" words", _on_words),
+        (" base forms", _on_base_forms),
+        (" inflections", _on_inflections),
+    )
+
+    def handle_line(self, line: str) -> None:
         """Derive progress milestones from Kindle Previewer console output."""
         if not line:
             return
 
-        # Exact match descriptions
-        if self._handle_description_update(line, "Getting base forms", "Loading base forms"):
-            return
-        if self._handle_description_update(line, "Creating dictionary", "Compiling dictionary"):
-            return
-        if self._handle_description_update(line, "Writing dictionary", "Writing MOBI file"):
+        description = self._DESCRIPTIONS.get(line)
+        if description is not None:
+            self.set_description(description)
             return
 
-        # Prefix match descriptions
         if line.startswith("Iterating through base forms"):
             self.set_description("Processing base forms")
             return
 
-        # Progress updates with numbers
-        # Handle words - silently ignore if pattern matches but number is invalid
-        if line.endswith(" words"):
-            if self._handle_words_progress(line):
+        for suffix, handler in self._COUNTERS:
+            if line.endswith(suffix):
+                count = self._extract_number_prefix(line, suffix)
+                if count is not None:
+                    handler(self, count)
                 return
-            return
-
-        # Handle base forms - silently ignore if pattern matches but number is invalid
-        if line.endswith(" base forms"):
-            base_forms = self._extract_number_prefix(line, " base forms")
-            if base_forms is not None:
-                self.base_forms = base_forms
-                self.set_total(base_forms)
-                self.advance_to(base_forms)
-            return
-
-        # Handle inflections - silently ignore if pattern matches but number is invalid
-        if line.endswith(" inflections"):
-            inflections = self._extract_number_prefix(line, " inflections")
-            if inflections is not None:
-                self.inflections = inflections
-            return
 
-        self.warnings.append(line)
+        self._warnings.append(line)
 
 
 ProgressAdvance = Callable[[int], None]
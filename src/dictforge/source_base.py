@@ -3,6 +3,8 @@ from typing import Any
 
 from rich.console import Console
 
+_FILTER_STAT_KEYS = ("count", "matched_entries", "skipped_empty")
+
 
 class DictionarySource:
     def __init__(self) -> None:
@@ -27,11 +29,11 @@ class DictionarySource:
 
     def record_filter_stats(self, language: str, meta: dict[str, Any]) -> None:
         """Cache filtered entry statistics for ``language``."""
-        stats = {
-            key: int(meta[key])
-            for key in ("count", "matched_entries", "skipped_empty")
-            if key in meta and isinstance(meta[key], (int, float))
-        }
+        stats = {}
+        for key in _FILTER_STAT_KEYS:
+            value = meta.get(key)
+            if isinstance(value, (int, float)):
+                stats[key] = int(value)
         if stats:
             self._filter_stats[language] = stats
 
@@ -52,10 +54,10 @@ class DictionarySource:
         if count is None:
             return
 
-        skipped_label = f", skipped {skipped:,} empty" if skipped is not None else ""
-        matched_label = f" of {matched:,} entries" if matched is not None else ""
-        console.print(
-            f"[dictforge] {language}: kept {count:,}{matched_label}{skipped_label}",
-            style="cyan",
-        )
+        parts = [f"[dictforge] {language}: kept {count:,}"]
+        if matched is not None:
+            parts.append(f" of {matched:,} entries")
+        if skipped is not None:
+            parts.append(f", skipped {skipped:,} empty")
+        console.print("".join(parts), style="cyan")
         self._logged_filter_languages.add(language_key)
@@ -1,18 +1,30 @@
 """FreeDict dictionary source implementation with StarDict format support."""
 
-import gzip
-import json
+import hashlib
+import lzma
+import mmap
+import os
 import re
+import shutil
 import struct
+import subprocess
 import sys
 import tarfile
-from collections.abc import Callable
-from contextlib import AbstractContextManager
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import requests
 
+try:  # ISA-L inflates .idx.gz/.dict.dz several times faster; stdlib gzip is the fallback
+    from isal.igzip import open as gzip_open
+except ModuleNotFoundError:
+    from gzip import open as gzip_open  # type: ignore[no-redef]
+
+from . import jsonl
 from .kaikki_utils import get_freedict_code
 from .source_base import DictionarySource
 from .translit import cyr_to_lat
@@ -21,24 +33,162 @@ FREEDICT_BASE_URL = "https://download.freedict.org/dictionaries"
 FREEDICT_CACHE_DIR = "freedict"
 FILTERED_CACHE_DIR = "filtered"
 DOWNLOADS_CACHE_DIR = "downloads"
+# Converted entries are cached next to the StarDict files they were parsed from
+PARSED_CACHE_PREFIX = ".dictforge-entries-"
+# Part of the cache key: bump whenever _convert_to_kaikki_format, _extract_glosses,
+# _read_definitions or transliteration start producing different entries.
+PARSED_CACHE_VERSION = 2
 
 # HTTP status codes
 HTTP_OK = 200
 # Magic numbers
-MAX_DEBUG_FILES = 10
-MAX_DEBUG_SUBDIRS = 5
 TIMEOUT_SECONDS = 10
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # bytes copied from the HTTP stream per read
 # Debug sample sizes
 MAX_MATCHED_SAMPLES = 5
 MAX_UNMATCHED_SAMPLES = 10
 # Heuristic splitting thresholds
 MIN_LENGTH_FOR_HEURISTIC_SPLIT = 8
 MIN_PART_LENGTH = 4
+# Common English word endings/starts that hint at a boundary in concatenated pivot words
+_PIVOT_WORD_ENDINGS = (
+    "ache",
+    "pain",
+    "colour",
+    "dye",
+    "city",
+    "town",
+    "box",
+    "chest",
+    "fog",
+    "mist",
+    "to",
+    "at",
+    "but",
+    "however",
+    "nevertheless",
+    "yet",
+)
+_PIVOT_WORD_STARTS = (
+    "to",
+    "at",
+    "but",
+    "how",
+    "never",
+    "yet",
+    "ache",
+    "pain",
+    "colour",
+    "dye",
+    "city",
+    "town",
+)
+
+# Links to .tar.xz archives in a FreeDict version directory listing
+_TAR_XZ_LINK_RE = re.compile(r'href="([^"]*\.tar\.xz)"')
+# Version directory links such as href="2023.09.10/" or href="0.2/"
+_VERSION_LINK_RE = re.compile(r'href="([0-9]+(?:\.[0-9]+)*(?:\.[0-9]{2}\.[0-9]{2})?)/\"')
+
+# Gloss cleanup in _extract_glosses
+_GLOSS_SPLIT_RE = re.compile(r"[;|\n]")
+# Pivot-word normalisation in _try_chained_translation
+_PUNCTUATION_RE = re.compile(r"[.,;:!?()\[\]{}]")
+_PIVOT_SPLIT_RE = re.compile(r"[,\s;]+")
+_CAMEL_CASE_SPLIT_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+# .idx record trailer: 32-bit big-endian offset and size after the NUL-terminated word
+_IDX_RECORD = struct.Struct(">II")
 
 ProgressAdvance = Callable[[int], None]
 ProgressFactory = Callable[..., AbstractContextManager[ProgressAdvance]]
 
 
+def _count_lines(path: Path) -> int:
+    """Count the newline-terminated lines in ``path`` without decoding it."""
+    with path.open("rb") as f:
+        return sum(chunk.count(b"\n") for chunk in iter(partial(f.read, 1 << 20), b""))
+
+
+def _parsed_cache_stem() -> str:
+    """Return the file name prefix shared by converted-entries caches of this version."""
+    return f"{PARSED_CACHE_PREFIX}v{PARSED_CACHE_VERSION}-"
+
+
+def _as_gloss_list(glosses: Any) -> list[Any]:
+    """Return a sense's ``glosses`` value as a list (a bare string becomes one item)."""
+    if isinstance(glosses, list):
+        return glosses
+    if isinstance(glosses, str):
+        return [glosses]
+    return []
+
+
+def _strip_tags(text: str) -> str:
+    """Remove ``<...>`` tags from ``text`` with a ``str.find`` scan.
+
+    Matches the old ``<[^>]+>`` regex: ``<>`` and an unterminated ``<`` are kept.
+    """
+    start = text.find("<")
+    if start < 0:
+        return text
+    parts = []
+    pos = 0
+    while start >= 0:
+        end = text.find(">", start + 1)
+        if end < 0:
+            break
+        if end > start + 1:
+            parts.append(text[pos:start])
+            pos = end + 1
+        start = text.find("<", end + 1)
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _gloss_key_set(senses: list[dict[str, Any]]) -> set[tuple[Any, ...]]:
+    """Return the gloss keys of ``senses``, as used to skip duplicate senses on merge."""
+    keys: set[tuple[Any, ...]] = set()
+    for sense in senses:
+        glosses = sense.get("glosses", [])
+        if isinstance(glosses, list):
+            keys.add(tuple(glosses))
+        elif isinstance(glosses, str):
+            keys.add((glosses,))
+    return keys
+
+
+@contextmanager
+def _staged_dir(target: Path) -> Iterator[Path]:
+    """Yield an empty hidden sibling of ``target`` that replaces it once the block succeeds.
+
+    An interrupted extraction then never leaves truncated files under ``target``,
+    whose contents the cache check trusts.
+    """
+    staging = target.with_name(f".{target.name}.part")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    try:
+        yield staging
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    shutil.rmtree(target, ignore_errors=True)
+    staging.rename(target)
+
+
+class _TeeReader:
+    """Minimal file-like reader that copies every chunk it returns into ``sink``."""
+
+    def __init__(self, source: IO[bytes], sink: IO[bytes]) -> None:
+        self._source = source
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._sink.write(data)
+        return data
+
+
 class FreeDictDownloadError(RuntimeError):
     """Raised when FreeDict resources cannot be downloaded."""
 
@@ -58,6 +208,9 @@ class FreeDictSource(DictionarySource):
     RELATED_LANGUAGES = {
         "Serbian": ["Croatian"],
     }
+    # Chained translations only go through English
+    PIVOT_LANGUAGE = "English"
+    PIVOT_CODE = get_freedict_code(PIVOT_LANGUAGE)
 
     def __init__(
         self,
@@ -81,22 +234,21 @@ class FreeDictSource(DictionarySource):
 
     def entry_has_content(self, entry: Any) -> bool:
         """Check if FreeDict entry has meaningful content."""
-        if not isinstance(entry, dict):
-            return False
-        senses = entry.get("senses")
-        if not isinstance(senses, list) or not senses:
+        senses = entry.get("senses") if isinstance(entry, dict) else None
+        if not isinstance(senses, list):
             return False
 
         for sense in senses:
             if not isinstance(sense, dict):
                 continue
             glosses = sense.get("glosses")
-            if isinstance(glosses, str) and glosses.strip():
+            if isinstance(glosses, str):
+                if glosses and not glosses.isspace():
+                    return True
+            elif isinstance(glosses, list) and any(
+                isinstance(gloss, str) and gloss and not gloss.isspace() for gloss in glosses
+            ):
                 return True
-            if isinstance(glosses, list):
-                for gloss in glosses:
-                    if isinstance(gloss, str) and gloss.strip():
-                        return True
         return False
 
     def get_entries(self, in_lang: str, out_lang: str) -> tuple[Path, int]:
@@ -138,12 +290,11 @@ class FreeDictSource(DictionarySource):
 
         # Transliterate glosses in all senses
         for sense in entry.get("senses", []):
-            if "glosses" in sense:
-                glosses = sense["glosses"]
-                if isinstance(glosses, list):
-                    sense["glosses"] = [cyr_to_lat(g) for g in glosses]
-                elif isinstance(glosses, str):
-                    sense["glosses"] = cyr_to_lat(glosses)
+            glosses = sense.get("glosses")
+            if isinstance(glosses, list):
+                sense["glosses"] = [cyr_to_lat(g) for g in glosses]
+            elif isinstance(glosses, str):
+                sense["glosses"] = cyr_to_lat(glosses)
 
         return entry
 
@@ -174,7 +325,7 @@ class FreeDictSource(DictionarySource):
             chained_path = self._try_chained_translation(in_lang, out_lang)
             if chained_path:
                 # Count entries in chained file
-                count = sum(1 for _ in chained_path.open("r", encoding="utf-8"))
+                count = _count_lines(chained_path)
                 return chained_path, count
             raise
 
@@ -186,9 +337,10 @@ class FreeDictSource(DictionarySource):
         # Check if we need to merge related languages
         related_langs = self._get_related_languages(in_lang)
 
+        entries: Iterable[dict[str, Any]]
         if not related_langs:
-            # Simple case: single language pair
-            entries = self._fetch_and_parse_dict(in_lang, out_lang, in_code, out_code)
+            # Simple case: single language pair, streamed straight into the cache file
+            entries = self._iter_dict_entries(in_lang, in_code, out_code)
         else:
             # Merge primary language with related languages
             entries = self._fetch_and_parse_dict(in_lang, out_lang, in_code, out_code)
@@ -216,11 +368,12 @@ class FreeDictSource(DictionarySource):
         freedict_root = self.cache_dir / FREEDICT_CACHE_DIR / FILTERED_CACHE_DIR
         output_path = freedict_root / f"{cache_key}.jsonl"
 
-        with output_path.open("w", encoding="utf-8") as f:
+        count = 0
+        with output_path.open("wb") as f:
             for entry in entries:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.write(jsonl.dumps_line(entry))
+                count += 1
 
-        count = len(entries)
         return output_path, count
 
     def _merge_entries_list(  # noqa: C901
@@ -235,6 +388,8 @@ class FreeDictSource(DictionarySource):
             word_lower = entry.get("word", "").lower()
             if word_lower:
                 word_index[word_lower] = idx
+        # Gloss keys of each target entry, built on its first conflict and kept up to date
+        gloss_keys: dict[int, set[tuple[Any, ...]]] = {}
 
         # Add or merge incoming entries
         for entry in incoming:
@@ -242,21 +397,19 @@ class FreeDictSource(DictionarySource):
             if not word_lower:
                 continue
 
-            if word_lower in word_index:
+            target_idx = word_index.get(word_lower)
+            if target_idx is not None:
                 # Merge senses
-                target_idx = word_index[word_lower]
                 target_entry = target[target_idx]
-                target_senses = target_entry.setdefault("senses", [])
-                incoming_senses = entry.get("senses", [])
+                target_senses = target_entry.get("senses")
+                if target_senses is None:
+                    target_senses = target_entry["senses"] = []
+                incoming_senses = entry.get("senses") or ()
 
-                # Build set of existing glosses to avoid duplicates
-                existing_glosses = set()
-                for sense in target_senses:
-                    glosses = sense.get("glosses", [])
-                    if isinstance(glosses, list):
-                        existing_glosses.add(tuple(glosses))
-                    elif isinstance(glosses, str):
-                        existing_glosses.add((glosses,))
+                # Set of existing glosses to avoid duplicates
+                existing_glosses = gloss_keys.get(target_idx)
+                if existing_glosses is None:
+                    existing_glosses = gloss_keys[target_idx] = _gloss_key_set(target_senses)
 
                 # Add new senses
                 for sense in incoming_senses:
@@ -264,7 +417,8 @@ class FreeDictSource(DictionarySource):
                     gloss_key = tuple(glosses) if isinstance(glosses, list) else (glosses,)
                     if gloss_key not in existing_glosses:
                         target_senses.append(sense)
-                        existing_glosses.add(gloss_key)
+                        if isinstance(glosses, list | str):
+                            existing_glosses.add(gloss_key)
             else:
                 # New word, add to target
                 target.append(entry)
@@ -278,25 +432,13 @@ class FreeDictSource(DictionarySource):
         out_code: str,
     ) -> list[dict[str, Any]]:
         """Fetch dictionary for language pair and parse to Kaikki format."""
-        lang_pair = f"{in_code}-{out_code}"
-
-        # Download and extract StarDict files
-        dict_dir = self._download_dictionary(lang_pair)
-        print(
-            f"\033[36m[dictforge] FreeDict: parsing StarDict files from {dict_dir}\033[0m",
-            file=sys.stderr,
-        )
-
-        # Parse StarDict files to entries
-        entries = self._parse_stardict_files(dict_dir)
+        entries = list(self._iter_dict_entries(lang_name, in_code, out_code))
         print(
-            f"\033[36m[dictforge] FreeDict: parsed {len(entries)} entries from {lang_pair}\033[0m",
+            f"\033[36m[dictforge] FreeDict: parsed {len(entries)} entries "
+            f"from {in_code}-{out_code}\033[0m",
             file=sys.stderr,
         )
-
-        # Apply transliteration for Serbian
         if lang_name == "Serbian":
-            entries = [self._apply_transliteration(e, lang_name) for e in entries]
             msg = (
                 f"\033[36m[dictforge] FreeDict: applied transliteration "
                 f"to {len(entries)} entries\033[0m"
@@ -305,6 +447,92 @@ class FreeDictSource(DictionarySource):
 
         return entries
 
+    def _iter_dict_entries(
+        self,
+        lang_name: str,
+        in_code: str,
+        out_code: str,
+    ) -> Iterator[dict[str, Any]]:
+        """Download the pair's StarDict files and return an iterator over its entries.
+
+        Downloading, conversion and writing the converted-entries cache all happen
+        before this returns, so errors surface here; the returned iterator only reads
+        the cache back.
+        """
+        lang_pair = f"{in_code}-{out_code}"
+
+        # Download and extract StarDict files
+        dict_dir = self._download_dictionary(lang_pair)
+        cache_path = self._parsed_cache_path(dict_dir, lang_name)
+        if cache_path.exists():
+            print(
+                f"\033[36m[dictforge] FreeDict: using cached entries for {lang_pair}\033[0m",
+                file=sys.stderr,
+            )
+            return self._read_parsed_cache(cache_path)
+
+        print(
+            f"\033[36m[dictforge] FreeDict: parsing StarDict files from {dict_dir}\033[0m",
+            file=sys.stderr,
+        )
+        entries = self._iter_stardict_entries(dict_dir)
+
+        # Apply transliteration for Serbian, entry by entry
+        if lang_name == "Serbian":
+            entries = (self._apply_transliteration(entry, lang_name) for entry in entries)
+        self._write_parsed_cache(entries, cache_path)
+        return self._read_parsed_cache(cache_path)
+
+    @staticmethod
+    def _parsed_cache_path(dict_dir: Path, lang_name: str) -> Path:
+        """Return the converted-entries cache path for the StarDict files in ``dict_dir``.
+
+        The name carries :data:`PARSED_CACHE_VERSION` and a digest of ``lang_name``
+        and the size and mtime of every StarDict file, so re-extracted or updated
+        files, as well as a changed conversion, get a fresh cache instead of a stale one.
+        """
+        digest = hashlib.blake2b(lang_name.encode("utf-8"), digest_size=8)
+        with os.scandir(dict_dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.name.startswith(PARSED_CACHE_PREFIX) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                digest.update(f"\0{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return dict_dir / f"{_parsed_cache_stem()}{digest.hexdigest()}.jsonl"
+
+    @staticmethod
+    def _read_parsed_cache(cache_path: Path) -> Iterator[dict[str, Any]]:
+        """Iterate entries previously stored by :meth:`_write_parsed_cache`."""
+        with cache_path.open("rb") as f:
+            for line in f:
+                yield jsonl.loads(line)
+
+    @staticmethod
+    def _write_parsed_cache(
+        entries: Iterable[dict[str, Any]],
+        cache_path: Path,
+    ) -> None:
+        """Save ``entries`` to ``cache_path``, retiring caches of older conversion versions.
+
+        The cache only appears once every entry has been written, so an interrupted run
+        leaves nothing behind that a later run could mistake for a complete cache.
+        Caches of the current version are left alone: they may belong to another
+        language read from the same files, possibly by a concurrent run.
+        """
+        part_path = cache_path.with_name(f"{cache_path.name}.part")
+        try:
+            with part_path.open("wb") as f:
+                for entry in entries:
+                    f.write(jsonl.dumps_line(entry))
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        current = _parsed_cache_stem()
+        for stale in cache_path.parent.glob(f"{PARSED_CACHE_PREFIX}*.jsonl"):
+            if not stale.name.startswith(current):
+                stale.unlink(missing_ok=True)
+        os.replace(part_path, cache_path)
+
     def _download_dictionary(self, lang_pair: str) -> Path:  # noqa: C901, PLR0912, PLR0915
         """Download and extract StarDict dictionary for language pair.
 
@@ -315,11 +543,14 @@ class FreeDictSource(DictionarySource):
         # Try to find existing extracted directory
         pair_dir = freedict_root / lang_pair
         if pair_dir.exists():
-            # Find version directory (e.g., "0.2", "1.3")
-            version_dirs = [d for d in pair_dir.iterdir() if d.is_dir()]
-            if version_dirs:
-                # Use latest version (sort by name)
-                latest_version = sorted(version_dirs)[-1]
+            # Find version directory (e.g., "0.2", "1.3"); DirEntry caches the type, so
+            # picking the latest by name costs no extra stat calls. Hidden entries are
+            # staging directories of unfinished extractions.
+            with os.scandir(pair_dir) as it:
+                versions = (e for e in it if e.is_dir() and not e.name.startswith("."))
+                latest = max(versions, key=lambda e: e.name, default=None)
+            if latest is not None:
+                latest_version = Path(latest.path)
                 if self._has_stardict_files(latest_version):
                     print(
                         f"\033[36m[dictforge] FreeDict: using cached {lang_pair}\033[0m",
@@ -347,6 +578,9 @@ class FreeDictSource(DictionarySource):
         downloads_dir = freedict_root / DOWNLOADS_CACHE_DIR
         download_path = downloads_dir / f"{lang_pair}-{version}.tar.xz"
 
+        extract_dir = pair_dir / version
+        extracted = False
+
         # Download if not cached
         if not download_path.exists():
             # Fetch directory listing to find actual filename
@@ -362,8 +596,7 @@ class FreeDictSource(DictionarySource):
                 response = self.session.get(version_url, timeout=TIMEOUT_SECONDS)
                 if response.status_code == HTTP_OK:
                     # Look for links to .tar.xz files
-                    tar_pattern = r'href="([^"]*\.tar\.xz)"'
-                    tar_files = re.findall(tar_pattern, response.text)
+                    tar_files = _TAR_XZ_LINK_RE.findall(response.text)
 
                     if tar_files:
                         # Prefer files with 'stardict' in the name
@@ -429,49 +662,23 @@ class FreeDictSource(DictionarySource):
                     f"Failed to download FreeDict {lang_pair} from {download_url}: {exc}",
                 ) from exc
 
-            # Save archive
-            with download_path.open("wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            print(
-                f"\033[36m[dictforge] FreeDict: downloaded {download_path.name}\033[0m",
-                file=sys.stderr,
-            )
-
-        # Extract to version directory
-        extract_dir = pair_dir / version
-        extract_dir.mkdir(parents=True, exist_ok=True)
+            # Decompress while downloading; the archive is kept for later re-extraction.
+            self._extract_stream(response, extract_dir, download_path, download_url)
+            extracted = True
 
-        try:
-            print(
-                f"\033[36m[dictforge] FreeDict: extracting {download_path.name}\033[0m",
-                file=sys.stderr,
-            )
-            with tarfile.open(download_path, "r:xz") as tar:
-                # Security: extractall is safe here as we control the source
-                # (freedict.org) and destination (our cache directory)
-                tar.extractall(path=extract_dir)  # noqa: S202
-        except (tarfile.TarError, OSError) as exc:
-            raise FreeDictParseError(
-                f"Failed to extract {download_path}: {exc}",
-            ) from exc
+        if not extracted:
+            try:
+                print(
+                    f"\033[36m[dictforge] FreeDict: extracting {download_path.name}\033[0m",
+                    file=sys.stderr,
+                )
+                self._extract_archive(download_path, extract_dir)
+            except (tarfile.TarError, lzma.LZMAError, OSError) as exc:
+                raise FreeDictParseError(
+                    f"Failed to extract {download_path}: {exc}",
+                ) from exc
 
         # Find the actual StarDict files (may be in a subdirectory)
-        print(
-            f"\033[36m[dictforge] FreeDict: searching for StarDict files in {extract_dir}\033[0m",
-            file=sys.stderr,
-        )
-
-        # List contents of extract_dir for debugging
-        if extract_dir.exists():
-            contents = list(extract_dir.iterdir())
-            preview = [p.name for p in contents[:5]]
-            msg = (
-                f"\033[36m[dictforge] FreeDict: extract_dir contains "
-                f"{len(contents)} items: {preview}\033[0m"
-            )
-            print(msg, file=sys.stderr)
-
         stardict_dir = self._find_stardict_dir(extract_dir)
         if not stardict_dir:
             raise FreeDictParseError(
@@ -484,6 +691,75 @@ class FreeDictSource(DictionarySource):
         )
         return stardict_dir
 
+    def _extract_archive(self, archive_path: Path, extract_dir: Path) -> None:
+        """Extract an on-disk ``.tar.xz`` into ``extract_dir``.
+
+        The system ``tar`` decompresses xz natively and is much faster than
+        :mod:`tarfile`; the latter is the fallback when ``tar`` is missing or fails.
+        """
+        with _staged_dir(extract_dir) as staging:
+            tar_bin = shutil.which("tar")
+            if tar_bin:
+                try:
+                    process = subprocess.run(
+                        [tar_bin, "-xJf", str(archive_path), "-C", str(staging)],
+                        check=False,
+                        capture_output=True,
+                    )
+                except OSError:
+                    pass
+                else:
+                    if process.returncode == 0:
+                        return
+                    # Start the fallback from an empty tree, not tar's partial one.
+                    shutil.rmtree(staging)
+                    staging.mkdir()
+            # Stream mode extracts members as their headers are read; "r:xz" would first
+            # decompress the whole archive to index it, then seek back through it again.
+            with tarfile.open(archive_path, "r|xz") as tar:
+                # Security: extractall is safe here as we control the source
+                # (freedict.org) and destination (our cache directory)
+                tar.extractall(path=staging)  # noqa: S202
+
+    def _extract_stream(
+        self,
+        response: requests.Response,
+        extract_dir: Path,
+        download_path: Path,
+        download_url: str,
+    ) -> None:
+        """Extract a streamed ``.tar.xz`` into ``extract_dir`` and save it to ``download_path``.
+
+        Both only appear under their final names once complete, as their presence
+        is what the cache checks look for.
+        """
+        print(
+            f"\033[36m[dictforge] FreeDict: downloading and extracting {download_url}\033[0m",
+            file=sys.stderr,
+        )
+        raw = response.raw
+        raw.decode_content = True
+        part_path = download_path.with_name(f"{download_path.name}.part")
+        try:
+            with part_path.open("wb") as archive, _staged_dir(extract_dir) as staging:
+                tee = _TeeReader(raw, archive)
+                with tarfile.open(fileobj=tee, mode="r|xz") as tar:
+                    # Security: extractall is safe here as we control the source
+                    # (freedict.org) and destination (our cache directory)
+                    tar.extractall(path=staging)  # noqa: S202
+                # tarfile stops at the end-of-archive marker; keep any padding after it.
+                while tee.read(DOWNLOAD_CHUNK_SIZE):
+                    pass
+        except (tarfile.TarError, lzma.LZMAError, OSError, requests.RequestException) as exc:
+            part_path.unlink(missing_ok=True)
+            raise FreeDictParseError(
+                f"Failed to extract {download_url}: {exc}",
+            ) from exc
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, download_path)
+
     def _find_latest_version(self, lang_pair: str) -> str | None:
         """Try to find latest version for a language pair."""
         # First, try to fetch the directory listing and parse available versions
@@ -492,9 +768,7 @@ class FreeDictSource(DictionarySource):
             response = self.session.get(index_url, timeout=TIMEOUT_SECONDS)
             if response.status_code == HTTP_OK:
                 # Parse HTML for version directories (looking for links like "2023.09.10/")
-                # Match patterns like: href="2023.09.10/" or href="0.2/"
-                version_pattern = r'href="([0-9]+(?:\.[0-9]+)*(?:\.[0-9]{2}\.[0-9]{2})?)/\"'
-                versions = re.findall(version_pattern, response.text)
+                versions = _VERSION_LINK_RE.findall(response.text)
                 if versions:
                     # Sort versions (newest first) - date-based versions will sort correctly
                     sorted_versions = sorted(versions, reverse=True)
@@ -553,31 +827,9 @@ class FreeDictSource(DictionarySource):
         """Check if directory contains .ifo, .idx, and .dict.dz files."""
         files = list(directory.glob("*.ifo"))
         if not files:
-            # Log what files ARE there
-            all_files = list(directory.glob("*"))
-            if all_files and len(all_files) <= MAX_DEBUG_FILES:
-                file_names = [f.name for f in all_files]
-                msg = (
-                    f"\033[36m[dictforge] FreeDict: {directory.name} contains: {file_names}\033[0m"
-                )
-                print(msg, file=sys.stderr)
             return False
 
         base_name = files[0].stem
-        msg = (
-            f"\033[36m[dictforge] FreeDict: found .ifo file '{files[0].name}', "
-            f"base_name='{base_name}'\033[0m"
-        )
-        print(msg, file=sys.stderr)
-
-        # List all files in directory for debugging
-        all_files = list(directory.glob("*"))
-        file_names = [f.name for f in all_files]
-        msg = (
-            f"\033[36m[dictforge] FreeDict: {directory.name} has {len(all_files)} "
-            f"files: {file_names}\033[0m"
-        )
-        print(msg, file=sys.stderr)
 
         # Check for .idx or .idx.gz
         has_idx = (directory / f"{base_name}.idx").exists() or (
@@ -586,52 +838,36 @@ class FreeDictSource(DictionarySource):
         has_dict = (directory / f"{base_name}.dict.dz").exists() or (
             directory / f"{base_name}.dict"
         ).exists()
-
-        msg = (
-            f"\033[36m[dictforge] FreeDict: looking for "
-            f"'{base_name}.idx/.idx.gz' (found={has_idx}), "
-            f"'{base_name}.dict.dz/.dict' (found={has_dict})\033[0m"
-        )
-        print(msg, file=sys.stderr)
-
         return has_idx and has_dict
 
     def _find_stardict_dir(self, root: Path) -> Path | None:
-        """Find directory containing StarDict files (may be in subdirectory)."""
-        # Check root first
-        print(
-            f"\033[36m[dictforge] FreeDict: checking root {root} for StarDict files\033[0m",
-            file=sys.stderr,
-        )
-        if self._has_stardict_files(root):
-            print(
-                "\033[36m[dictforge] FreeDict: found StarDict files in root\033[0m",
-                file=sys.stderr,
-            )
-            return root
-
-        # Search subdirectories (max depth 2)
-        subdirs = [d for d in root.rglob("*") if d.is_dir()]
-        print(
-            f"\033[36m[dictforge] FreeDict: searching {len(subdirs)} subdirectories\033[0m",
-            file=sys.stderr,
-        )
+        """Find directory containing StarDict files (may be in subdirectory).
 
-        for i, subdir in enumerate(subdirs):
-            if i < MAX_DEBUG_SUBDIRS:  # Log first few for debugging
-                rel_path = subdir.relative_to(root)
-                msg = f"\033[36m[dictforge] FreeDict: checking {rel_path}\033[0m"
-                print(msg, file=sys.stderr)
-            if self._has_stardict_files(subdir):
-                rel_path = subdir.relative_to(root)
-                msg = f"\033[36m[dictforge] FreeDict: found StarDict files in {rel_path}\033[0m"
-                print(msg, file=sys.stderr)
-                return subdir
+        Walks the tree breadth-first and stops at the first match.
+        """
+        pending = deque([root])
+        while pending:
+            directory = pending.popleft()
+            if self._has_stardict_files(directory):
+                return directory
+            try:
+                with os.scandir(directory) as it:
+                    subdirs = sorted(e.path for e in it if e.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+            pending.extend(map(Path, subdirs))
 
         return None
 
     def _parse_stardict_files(self, dict_dir: Path) -> list[dict[str, Any]]:
         """Parse StarDict .ifo, .idx/.idx.gz, .dict/.dict.dz files to Kaikki format."""
+        return list(self._iter_stardict_entries(dict_dir))
+
+    def _iter_stardict_entries(self, dict_dir: Path) -> Iterator[dict[str, Any]]:
+        """Read the StarDict files in ``dict_dir`` and iterate their non-empty entries.
+
+        Missing or unreadable files raise immediately; entries are converted lazily.
+        """
         # Find .ifo file
         ifo_files = list(dict_dir.glob("*.ifo"))
         if not ifo_files:
@@ -669,13 +905,11 @@ class FreeDictSource(DictionarySource):
         definitions = self._read_definitions(actual_dict_path, index)
 
         # Convert to Kaikki format
-        entries = []
-        for word, definition in definitions.items():
-            entry = self._convert_to_kaikki_format(word, definition, metadata)
-            if self.entry_has_content(entry):
-                entries.append(entry)
-
-        return entries
+        converted = (
+            self._convert_to_kaikki_format(word, definition, metadata)
+            for word, definition in definitions.items()
+        )
+        return (entry for entry in converted if self.entry_has_content(entry))
 
     def _read_ifo_metadata(self, ifo_path: Path) -> dict[str, str]:
         """Parse .ifo metadata file."""
@@ -699,77 +933,127 @@ class FreeDictSource(DictionarySource):
 
         Format: word\\0 + offset[4 bytes BE] + size[4 bytes BE]
         """
-        index = []
         try:
             # Handle both .idx and .idx.gz
             if idx_path.suffix == ".gz":
-                with gzip.open(idx_path, "rb") as f:
-                    data = f.read()
-            else:
-                with idx_path.open("rb") as f:
-                    data = f.read()
+                with gzip_open(idx_path, "rb") as f:
+                    return self._parse_index(f.read())
+            with idx_path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                # Map the plain index instead of copying it into a bytes object.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._parse_index(data)
         except OSError as exc:
             raise FreeDictParseError(f"Failed to read {idx_path}: {exc}") from exc
 
+    @staticmethod
+    def _parse_index(data: bytes | mmap.mmap) -> list[tuple[str, int, int]]:
+        """Split raw .idx contents into ``(word, offset, size)`` records."""
+        find = data.find
+        unpack_from = _IDX_RECORD.unpack_from
+        data_len = len(data)
+        word_bytes: list[bytes] = []
+        records: list[tuple[int, int]] = []
         pos = 0
-        while pos < len(data):
+        while pos < data_len:
             # Find null terminator for word
-            null_pos = data.find(b"\x00", pos)
+            null_pos = find(b"\x00", pos)
             if null_pos == -1:
                 break
 
-            word_bytes = data[pos:null_pos]
-            try:
-                word = word_bytes.decode("utf-8", errors="ignore")
-            except UnicodeDecodeError:
-                word = word_bytes.decode("latin-1", errors="ignore")
-
-            # Read offset and size (big-endian 4-byte integers)
-            offset_pos = null_pos + 1
-            if offset_pos + 8 > len(data):
+            # Read offset and size (big-endian 4-byte integers) without slicing
+            record_end = null_pos + 1 + _IDX_RECORD.size
+            if record_end > data_len:
                 break
+            records.append(unpack_from(data, null_pos + 1))
+            word_bytes.append(data[pos:null_pos])
+            pos = record_end
 
-            offset = struct.unpack(">I", data[offset_pos : offset_pos + 4])[0]
-            size = struct.unpack(">I", data[offset_pos + 4 : offset_pos + 8])[0]
-
-            index.append((word, offset, size))
-            pos = offset_pos + 8
-
-        return index
+        if not records:
+            return []
+        # Decode all headwords in one call; NUL never occurs inside a UTF-8 sequence,
+        # so this matches decoding each word on its own.
+        words = b"\x00".join(word_bytes).decode("utf-8", errors="ignore").split("\x00")
+        return [(word, offset, size) for word, (offset, size) in zip(words, records, strict=True)]
 
     def _read_definitions(
         self,
         dict_path: Path,
         index: list[tuple[str, int, int]],
     ) -> dict[str, str]:
-        """Read definitions from .dict or .dict.dz file."""
-        definitions = {}
+        """Read definitions from .dict or .dict.dz file.
 
+        Records are read in offset order so the (possibly compressed) file is
+        streamed once instead of being decompressed into memory as a whole.
+        Records that extend past the end of the file are skipped.
+        """
+        payloads: list[bytes | None] = [None] * len(index)
         try:
             # Handle compressed (.dz) or plain (.dict) file
-            if dict_path.suffix == ".dz":
-                with gzip.open(dict_path, "rb") as f:
-                    dict_data = f.read()
-            else:
-                with dict_path.open("rb") as f:
-                    dict_data = f.read()
-        except (OSError, gzip.BadGzipFile) as exc:
+            opener = gzip_open if dict_path.suffix == ".dz" else open
+            with opener(dict_path, "rb") as f:
+                valid_end, empty_records = self._read_payloads(f, index, payloads)
+                if empty_records:
+                    self._accept_empty_records(f, index, payloads, empty_records, valid_end)
+        except (OSError, EOFError) as exc:
             raise FreeDictParseError(f"Failed to read {dict_path}: {exc}") from exc
 
-        # Extract definitions using index
-        for word, offset, size in index:
-            if offset + size > len(dict_data):
-                continue
-
-            definition_bytes = dict_data[offset : offset + size]
-            try:
-                definition = definition_bytes.decode("utf-8", errors="ignore")
-            except UnicodeDecodeError:
-                definition = definition_bytes.decode("latin-1", errors="ignore")
+        # Invalid UTF-8 becomes U+FFFD rather than silently vanishing from the gloss.
+        definitions = {}
+        for (word, _, _), payload in zip(index, payloads, strict=True):
+            if payload is not None:
+                definitions[word] = payload.decode("utf-8", errors="replace").strip()
+        return definitions
 
-            definitions[word] = definition.strip()
+    @staticmethod
+    def _read_payloads(
+        f: IO[bytes],
+        index: list[tuple[str, int, int]],
+        payloads: list[bytes | None],
+    ) -> tuple[int, list[int]]:
+        """Fill ``payloads`` with the non-empty records of ``index``, read in offset order.
 
-        return definitions
+        Returns the end of the last complete record and the positions of the
+        zero-length records, which are left to :meth:`_accept_empty_records`.
+        """
+        pos = valid_end = 0
+        previous: tuple[int, int, bytes] | None = None
+        empty_records: list[int] = []
+        for i in sorted(range(len(index)), key=lambda i: index[i][1]):
+            _, offset, size = index[i]
+            if size == 0:
+                empty_records.append(i)
+                continue
+            if previous is not None and previous[:2] == (offset, size):
+                # Several headwords sharing one definition record.
+                payloads[i] = previous[2]
+                continue
+            if offset != pos:
+                f.seek(offset)
+            data = f.read(size)
+            pos = offset + len(data)
+            if len(data) == size:
+                payloads[i] = data
+                previous = (offset, size, data)
+                valid_end = max(valid_end, pos)
+        return valid_end, empty_records
+
+    @staticmethod
+    def _accept_empty_records(
+        f: IO[bytes],
+        index: list[tuple[str, int, int]],
+        payloads: list[bytes | None],
+        empty_records: list[int],
+        valid_end: int,
+    ) -> None:
+        """Mark zero-length records whose offset lies within the file as empty definitions."""
+        # The tail after the last record is usually tiny, so measure the length by reading it.
+        f.seek(valid_end)
+        file_size = valid_end + len(f.read())
+        for i in empty_records:
+            if index[i][1] <= file_size:
+                payloads[i] = b""
 
     def _convert_to_kaikki_format(
         self,
@@ -799,10 +1083,10 @@ class FreeDictSource(DictionarySource):
         StarDict definitions can be plain text or HTML. Extract meaningful glosses.
         """
         # Remove common HTML tags
-        text = re.sub(r"<[^>]+>", "", definition)
+        text = _strip_tags(definition)
 
         # Split on common delimiters
-        parts = re.split(r"[;|\n]", text)
+        parts = _GLOSS_SPLIT_RE.split(text)
         glosses = [part.strip() for part in parts if part.strip()]
 
         # If no delimiters found, return whole text
@@ -811,6 +1095,105 @@ class FreeDictSource(DictionarySource):
 
         return glosses
 
+    @staticmethod
+    def _add_pivot_glosses(  # noqa: C901, PLR0912
+        pivot_word: str,
+        pivot_map: dict[str, list[str]],
+        final_glosses: set[str],
+    ) -> None:
+        """Add the target glosses ``pivot_map`` yields for ``pivot_word`` to ``final_glosses``.
+
+        Tries an exact match first, then progressively looser splits of the pivot word.
+        """
+        pivot_lower = pivot_word.lower().strip()
+        # Try exact match first
+        if pivot_lower in pivot_map:
+            final_glosses.update(pivot_map[pivot_lower])
+            return
+
+        # Try normalized match (remove punctuation)
+        normalized = _PUNCTUATION_RE.sub("", pivot_lower).strip()
+        if normalized and normalized in pivot_map:
+            final_glosses.update(pivot_map[normalized])
+            return
+
+        # Try splitting on common separators
+        # (e.g., "hello, world" -> "hello", "world")
+        parts = _PIVOT_SPLIT_RE.split(pivot_lower)
+        found_match = False
+        for part_raw in parts:
+            part = part_raw.strip()
+            if part and part in pivot_map:
+                final_glosses.update(pivot_map[part])
+                found_match = True
+        if found_match:
+            return
+
+        # Try splitting concatenated words (camelCase boundaries)
+        # Examples: "YugoslavYugoslavian" -> ["yugoslav", "yugoslavian"]
+        #          "EnglishmanSassenach" -> ["englishman", "sassenach"]
+        # Split on CamelCase: lowercase/uppercase followed by uppercase
+        # First, try on original case, then lowercase
+        camel_case_split = _CAMEL_CASE_SPLIT_RE.split(pivot_word)
+        if len(camel_case_split) > 1:
+            for split_word in camel_case_split:
+                split_word_lower = split_word.lower().strip()
+                if split_word_lower and split_word_lower in pivot_map:
+                    final_glosses.update(pivot_map[split_word_lower])
+                    found_match = True
+            if found_match:
+                return
+
+        # Try heuristic: split concatenated lowercase words
+        # Look for patterns like "word1word2" where both parts might be words
+        # Examples: "achepain", "colourdye", "citytown"
+        if not found_match and pivot_lower.islower():
+            # First, try common word boundaries
+            # (common English word endings/startings)
+            # Try splitting at positions where common words might start/end
+            common_boundaries = []
+            for ending in _PIVOT_WORD_ENDINGS:
+                if pivot_lower.endswith(ending) and len(pivot_lower) > len(ending):
+                    split_pos = len(pivot_lower) - len(ending)
+                    if split_pos >= MIN_PART_LENGTH:
+                        common_boundaries.append(split_pos)
+
+            # Try common word starts
+            for start in _PIVOT_WORD_STARTS:
+                if pivot_lower.startswith(start) and len(pivot_lower) > len(start):
+                    split_pos = len(start)
+                    if len(pivot_lower) - split_pos >= MIN_PART_LENGTH:
+                        common_boundaries.append(split_pos)
+
+            # Try all common boundaries first (more likely to be correct)
+            for split_pos in sorted(set(common_boundaries)):
+                part1 = pivot_lower[:split_pos]
+                part2 = pivot_lower[split_pos:]
+                if part1 in pivot_map:
+                    final_glosses.update(pivot_map[part1])
+                if part2 in pivot_map:
+                    final_glosses.update(pivot_map[part2])
+                if part1 in pivot_map or part2 in pivot_map:
+                    found_match = True
+                    break
+
+            # If no match with common boundaries, try systematic splitting
+            # for long words (minimum length check)
+            if not found_match and len(pivot_lower) > MIN_LENGTH_FOR_HEURISTIC_SPLIT:
+                # Try splitting at various positions
+                for split_pos in range(
+                    MIN_PART_LENGTH,
+                    len(pivot_lower) - (MIN_PART_LENGTH - 1),
+                ):
+                    part1 = pivot_lower[:split_pos]
+                    part2 = pivot_lower[split_pos:]
+                    if part1 in pivot_map:
+                        final_glosses.update(pivot_map[part1])
+                    if part2 in pivot_map:
+                        final_glosses.update(pivot_map[part2])
+                    if part1 in pivot_map or part2 in pivot_map:
+                        break
+
     def _try_chained_translation(  # noqa: C901, PLR0912, PLR0915
         self,
         in_lang: str,
@@ -820,8 +1203,7 @@ class FreeDictSource(DictionarySource):
 
         Example: Serbian → Russian becomes Serbian → English → Russian
         """
-        # Only chain through English
-        pivot_lang = "English"
+        pivot_lang = self.PIVOT_LANGUAGE
 
         msg = (
             f"\033[36m[dictforge] FreeDict: attempting chained translation "
@@ -829,11 +1211,6 @@ class FreeDictSource(DictionarySource):
         )
         print(msg, file=sys.stderr)
 
-        # Check if we can build the chain
-        in_code = get_freedict_code(in_lang)
-        pivot_code = get_freedict_code(pivot_lang)
-        out_code = get_freedict_code(out_lang)
-
         # Check cache first
         cache_key = f"{in_lang}__{out_lang}__chained"
         freedict_root = self.cache_dir / FREEDICT_CACHE_DIR / FILTERED_CACHE_DIR
@@ -846,6 +1223,11 @@ class FreeDictSource(DictionarySource):
             )
             return cached_path
 
+        # Check if we can build the chain
+        in_code = get_freedict_code(in_lang)
+        pivot_code = self.PIVOT_CODE
+        out_code = get_freedict_code(out_lang)
+
         try:
             # Get first pair: in_lang → English
             msg = (
@@ -888,9 +1270,7 @@ class FreeDictSource(DictionarySource):
             first_pair_english_words = set()
             for entry in first_pair_entries[:100]:  # Sample first 100
                 for sense in entry.get("senses", []):
-                    sense_glosses = sense.get("glosses", [])
-                    if isinstance(sense_glosses, str):
-                        sense_glosses = [sense_glosses]
+                    sense_glosses = _as_gloss_list(sense.get("glosses"))
                     if sense_glosses:
                         first_pair_words_with_glosses += 1
                         for gloss in sense_glosses:
@@ -916,19 +1296,19 @@ class FreeDictSource(DictionarySource):
             second_pair_words = set()
             for entry in second_pair_entries:
                 word_lower = entry.get("word", "").lower().strip()
-                glosses = []
-                for sense in entry.get("senses", []):
-                    sense_glosses = sense.get("glosses", [])
-                    if isinstance(sense_glosses, list):
-                        glosses.extend(sense_glosses)
-                    elif isinstance(sense_glosses, str):
-                        glosses.append(sense_glosses)
-                if glosses and word_lower:
+                if not word_lower:
+                    continue
+                glosses = [
+                    gloss
+                    for sense in entry.get("senses", [])
+                    for gloss in _as_gloss_list(sense.get("glosses"))
+                ]
+                if glosses:
                     second_pair_words.add(word_lower)
                     # Store by exact word
                     pivot_map[word_lower] = glosses
                     # Also store by normalized word (remove common punctuation)
-                    normalized = re.sub(r"[.,;:!?()\[\]{}]", "", word_lower).strip()
+                    normalized = _PUNCTUATION_RE.sub("", word_lower).strip()
                     if normalized and normalized != word_lower and normalized not in pivot_map:
                         # If normalized differs, store it too (but prefer exact match)
                         pivot_map[normalized] = glosses
@@ -946,197 +1326,55 @@ class FreeDictSource(DictionarySource):
                 )
                 print(msg, file=sys.stderr)
 
-            # Build chained entries
-            chained_entries = []
+            # Build chained entries, writing each one to the cache as soon as it is matched.
+            # The cache only replaces the final path once complete, so a failed run leaves
+            # no truncated file behind for the cache check above.
+            part_path = cached_path.with_name(f"{cached_path.name}.part")
             matched_count = 0
             unmatched_count = 0
             unmatched_samples: list[str] = []
             matched_samples: list[str] = []
-            for entry in first_pair_entries:
-                word = entry.get("word", "")
-                final_glosses: set[str] = set()
+            try:
+                with part_path.open("wb") as f:
+                    for entry in first_pair_entries:
+                        word = entry.get("word", "")
+                        final_glosses: set[str] = set()
 
-                # For each gloss in first pair, look up in pivot map
-                for sense in entry.get("senses", []):
-                    sense_glosses = sense.get("glosses", [])
-                    if isinstance(sense_glosses, str):
-                        sense_glosses = [sense_glosses]
-
-                    for pivot_word in sense_glosses:
-                        if not isinstance(pivot_word, str):
-                            continue
-                        pivot_lower = pivot_word.lower().strip()
-                        # Try exact match first
-                        if pivot_lower in pivot_map:
-                            final_glosses.update(pivot_map[pivot_lower])
-                            continue
-
-                        # Try normalized match (remove punctuation)
-                        normalized = re.sub(r"[.,;:!?()\[\]{}]", "", pivot_lower).strip()
-                        if normalized and normalized in pivot_map:
-                            final_glosses.update(pivot_map[normalized])
-                            continue
-
-                        # Try splitting on common separators
-                        # (e.g., "hello, world" -> "hello", "world")
-                        parts = re.split(r"[,\s;]+", pivot_lower)
-                        found_match = False
-                        for part_raw in parts:
-                            part = part_raw.strip()
-                            if part and part in pivot_map:
-                                final_glosses.update(pivot_map[part])
-                                found_match = True
-                        if found_match:
-                            continue
-
-                        # Try splitting concatenated words (camelCase boundaries)
-                        # Examples: "YugoslavYugoslavian" -> ["yugoslav", "yugoslavian"]
-                        #          "EnglishmanSassenach" -> ["englishman", "sassenach"]
-                        # Split on CamelCase: lowercase/uppercase followed by uppercase
-                        # First, try on original case, then lowercase
-                        camel_case_split = re.split(r"(?<=[a-z])(?=[A-Z])", pivot_word)
-                        if len(camel_case_split) > 1:
-                            for split_word in camel_case_split:
-                                split_word_lower = split_word.lower().strip()
-                                if split_word_lower and split_word_lower in pivot_map:
-                                    final_glosses.update(pivot_map[split_word_lower])
-                                    found_match = True
-                            if found_match:
-                                continue
-
-                        # Try heuristic: split concatenated lowercase words
-                        # Look for patterns like "word1word2" where both parts might be words
-                        # Examples: "achepain", "colourdye", "citytown"
-                        if not found_match and pivot_lower.islower():
-                            # First, try common word boundaries
-                            # (common English word endings/startings)
-                            # Try splitting at positions where common words might start/end
-                            common_boundaries = []
-                            # Common word endings that might indicate a word boundary
-                            endings = [
-                                "ache",
-                                "pain",
-                                "colour",
-                                "dye",
-                                "city",
-                                "town",
-                                "box",
-                                "chest",
-                                "fog",
-                                "mist",
-                                "to",
-                                "at",
-                                "but",
-                                "however",
-                                "nevertheless",
-                                "yet",
-                            ]
-                            for ending in endings:
-                                if pivot_lower.endswith(ending) and len(pivot_lower) > len(ending):
-                                    split_pos = len(pivot_lower) - len(ending)
-                                    if split_pos >= MIN_PART_LENGTH:
-                                        common_boundaries.append(split_pos)
-
-                            # Try common word starts
-                            starts = [
-                                "to",
-                                "at",
-                                "but",
-                                "how",
-                                "never",
-                                "yet",
-                                "ache",
-                                "pain",
-                                "colour",
-                                "dye",
-                                "city",
-                                "town",
-                            ]
-                            for start in starts:
-                                if pivot_lower.startswith(start) and len(pivot_lower) > len(start):
-                                    split_pos = len(start)
-                                    if len(pivot_lower) - split_pos >= MIN_PART_LENGTH:
-                                        common_boundaries.append(split_pos)
-
-                            # Try all common boundaries first (more likely to be correct)
-                            for split_pos in sorted(set(common_boundaries)):
-                                part1 = pivot_lower[:split_pos]
-                                part2 = pivot_lower[split_pos:]
-                                if part1 in pivot_map:
-                                    final_glosses.update(pivot_map[part1])
-                                if part2 in pivot_map:
-                                    final_glosses.update(pivot_map[part2])
-                                if part1 in pivot_map or part2 in pivot_map:
-                                    found_match = True
-                                    break
-
-                            # If no match with common boundaries, try systematic splitting
-                            # for long words (minimum length check)
-                            if (
-                                not found_match
-                                and len(pivot_lower) > MIN_LENGTH_FOR_HEURISTIC_SPLIT
-                            ):
-                                # Try splitting at various positions
-                                for split_pos in range(
-                                    MIN_PART_LENGTH,
-                                    len(pivot_lower) - (MIN_PART_LENGTH - 1),
-                                ):
-                                    part1 = pivot_lower[:split_pos]
-                                    part2 = pivot_lower[split_pos:]
-                                    if part1 in pivot_map:
-                                        final_glosses.update(pivot_map[part1])
-                                    if part2 in pivot_map:
-                                        final_glosses.update(pivot_map[part2])
-                                    if part1 in pivot_map or part2 in pivot_map:
-                                        break
-
-                if final_glosses:
-                    matched_count += 1
-                    if len(matched_samples) < MAX_MATCHED_SAMPLES:
-                        matched_samples.append(f"{word} -> {len(final_glosses)} glosses")
-                    chained_entry = {
-                        "word": word,
-                        "pos": "noun",  # FreeDict doesn't provide POS, use default
-                        "senses": [
-                            {
-                                "glosses": sorted(final_glosses),
-                                "raw_glosses": sorted(final_glosses),
-                            },
-                        ],
-                    }
-                    chained_entries.append(chained_entry)
-                else:
-                    unmatched_count += 1
-                    if len(unmatched_samples) < MAX_UNMATCHED_SAMPLES:
-                        # Collect sample of unmatched words and their English glosses
-                        sample_glosses = []
+                        # For each gloss in first pair, look up in pivot map
                         for sense in entry.get("senses", []):
-                            sense_glosses = sense.get("glosses", [])
-                            if isinstance(sense_glosses, str):
-                                sense_glosses = [sense_glosses]
-                            sample_glosses.extend(sense_glosses[:2])  # First 2 glosses
-                        if sample_glosses:
-                            unmatched_samples.append(
-                                f"{word} (EN: {', '.join(str(g) for g in sample_glosses[:3])})",
-                            )
-
-                if final_glosses:
-                    chained_entry = {
-                        "word": word,
-                        "pos": "noun",  # FreeDict doesn't provide POS, use default
-                        "senses": [
-                            {
-                                "glosses": sorted(final_glosses),
-                                "raw_glosses": sorted(final_glosses),
-                            },
-                        ],
-                    }
-                    chained_entries.append(chained_entry)
-
-            # Write to cache
-            with cached_path.open("w", encoding="utf-8") as f:
-                for entry in chained_entries:
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                            for pivot_word in _as_gloss_list(sense.get("glosses")):
+                                if not isinstance(pivot_word, str):
+                                    continue
+                                self._add_pivot_glosses(pivot_word, pivot_map, final_glosses)
+
+                        if final_glosses:
+                            matched_count += 1
+                            if len(matched_samples) < MAX_MATCHED_SAMPLES:
+                                matched_samples.append(f"{word} -> {len(final_glosses)} glosses")
+                            # Both fields are serialised immediately, so one sorted list
+                            # can back them both
+                            gloss_list = sorted(final_glosses)
+                            chained_entry = {
+                                "word": word,
+                                "pos": "noun",  # FreeDict doesn't provide POS, use default
+                                "senses": [{"glosses": gloss_list, "raw_glosses": gloss_list}],
+                            }
+                            f.write(jsonl.dumps_line(chained_entry))
+                        else:
+                            unmatched_count += 1
+                            if len(unmatched_samples) < MAX_UNMATCHED_SAMPLES:
+                                # Collect sample of unmatched words and their English glosses
+                                sample_glosses = []
+                                for sense in entry.get("senses", []):
+                                    # First 2 glosses
+                                    sample_glosses.extend(_as_gloss_list(sense.get("glosses"))[:2])
+                                if sample_glosses:
+                                    sample = ", ".join(str(g) for g in sample_glosses[:3])
+                                    unmatched_samples.append(f"{word} (EN: {sample})")
+                os.replace(part_path, cached_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
 
             # Log statistics
             total_first = len(first_pair_entries)
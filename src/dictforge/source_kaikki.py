@@ -1,15 +1,27 @@
 import gzip
+import itertools
 import json
-from collections.abc import Callable
-from contextlib import AbstractContextManager
+import multiprocessing
+import os
+import pickle
+import threading
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 from html.parser import HTMLParser
 from json import JSONDecodeError
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TypedDict
 from urllib.parse import quote
 
 import requests
 
+from . import jsonl
 from .kaikki_utils import lang_meta
 from .source_base import DictionarySource
 
@@ -19,8 +31,14 @@ FILTERED_CACHE_DIR = "filtered"
 META_SUFFIX = ".meta.json"
 LANGUAGE_CACHE_DIR = "languages"
 TRANSLATION_CACHE_DIR = "translations"
+TRANSLATION_PIVOT = "English"  # the only language whose Kaikki entries carry translation tables
 LANGUAGE_DUMP_URL = "https://kaikki.org/dictionary/{lang}/kaikki.org-dictionary-{slug}.jsonl"
 RESPONSE_EXCERPT_MAX_LENGTH = 200
+DOWNLOAD_CHUNK_SIZE = 8 << 20  # bytes pulled from the HTTP stream per read
+GZIP_READ_SIZE = 4 << 20  # compressed bytes read from disk per zlib call
+FILTER_BLOCK_SIZE = 64 << 20  # decompressed bytes handed to one filter worker
+FILTER_MAX_WORKERS = 8
+PREFETCH_TIMEOUT = (10, 30)  # connect and per-read seconds for background downloads
 ELLIPSE = "..."
 
 ProgressAdvance = Callable[[int], None]
@@ -54,6 +72,167 @@ class KaikkiEntry(TypedDict, total=False):
     senses: list[KaikkiSense]
 
 
+@lru_cache(maxsize=256)
+def _language_slug(value: str) -> str:
+    """Collapse a language name to a Kaikki/filename friendly slug (memoised)."""
+    return value.replace(" ", "").replace("-", "").replace("'", "")
+
+
+@lru_cache(maxsize=256)
+def _language_needles(language: str) -> tuple[bytes, bytes | None]:
+    """Return the JSON string forms of ``language`` used to pre-screen raw dump lines.
+
+    The second item is the ``\\uXXXX``-escaped spelling, only when it differs.
+    """
+    needle = json.dumps(language, ensure_ascii=False).encode("utf-8")
+    escaped = json.dumps(language).encode("ascii")
+    return needle, escaped if escaped != needle else None
+
+
+def _has_text(values: Any) -> bool:
+    """Return True when ``values`` is, or is a list holding, a non-blank string."""
+    if type(values) is str:
+        return bool(values) and not values.isspace()
+    if type(values) is list:
+        for value in values:
+            if type(value) is str and value and not value.isspace():
+                return True
+    return False
+
+
+def _entry_has_content(entry: Any) -> bool:
+    """Return True when ``entry`` carries at least one non-blank gloss."""
+    try:
+        senses = entry["senses"]
+    except (TypeError, KeyError):  # not a JSON object, or an entry without senses
+        return False
+    if type(senses) is not list:
+        return False
+    for sense in senses:
+        if type(sense) is not dict:
+            continue
+        if _has_text(sense.get("glosses")) or _has_text(sense.get("raw_glosses")):
+            return True
+    return False
+
+
+def _iter_gunzipped(path: Path, read_size: int = GZIP_READ_SIZE) -> Iterator[bytes]:
+    """Yield the decompressed contents of the gzip file at ``path`` in large chunks.
+
+    Handles concatenated gzip members and NUL padding after a member (common on
+    tape or ``dd`` copies) like :mod:`gzip` does, without its per-line buffering layer.
+    """
+    wbits = zlib.MAX_WBITS | 16  # expect a gzip header
+    decompressor = zlib.decompressobj(wbits)
+    in_member = False
+    member_done = False
+    try:
+        with path.open("rb") as fh:
+            while chunk := fh.read(read_size):
+                while chunk:
+                    if member_done and not in_member:
+                        chunk = chunk.lstrip(b"\0")
+                        if not chunk:
+                            break
+                    in_member = True
+                    data = decompressor.decompress(chunk)
+                    if data:
+                        yield data
+                    if not decompressor.eof:
+                        break
+                    chunk = decompressor.unused_data
+                    decompressor = zlib.decompressobj(wbits)
+                    in_member = False
+                    member_done = True
+    except zlib.error as exc:
+        raise gzip.BadGzipFile(f"Invalid gzip data in {path}: {exc}") from exc
+    if in_member:
+        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+
+def _iter_line_blocks(chunks: Iterable[bytes], block_size: int) -> Iterator[bytes]:
+    """Regroup ``chunks`` into roughly ``block_size`` blocks that end on a line boundary."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= block_size:
+            cut = (buffer.rfind(b"\n", 0, block_size) + 1) or (buffer.find(b"\n", block_size) + 1)
+            if not cut:
+                break
+            yield bytes(buffer[:cut])
+            del buffer[:cut]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _check_object_lines(block: bytes) -> None:
+    """Raise ``JSONDecodeError`` for the first non-blank line of ``block`` not shaped ``{...}``.
+
+    JSON strings cannot contain raw newlines, so when every line opens with
+    ``{`` and closes with ``}`` the counts below match and no line is visited.
+    """
+    lines = block.count(b"\n") + (0 if block.endswith(b"\n") else 1)
+    opened = block.count(b"\n{") + block.startswith(b"{")
+    closed = block.count(b"}\n") + block.endswith(b"}")
+    if opened == closed == lines:
+        return
+    for line in block.split(b"\n"):
+        stripped = line.strip()
+        if stripped and not (stripped.startswith(b"{") and stripped.endswith(b"}")):
+            jsonl.loads(stripped)
+
+
+def _filter_block(block: bytes, language: str) -> tuple[bytes, int, int, int, int]:
+    """Keep the lines of ``block`` whose entry belongs to ``language``.
+
+    Every line must look like a JSON object and the first non-blank line is
+    parsed, so truncated or non-JSON input is reported; beyond that only lines
+    containing the JSON-encoded language name are parsed. Runs in worker
+    processes, hence a module-level function.
+
+    Returns ``(kept_lines, lines, matched, kept, skipped_empty)``.
+    """
+    _check_object_lines(block)
+    needle, escaped_needle = _language_needles(language)
+    size = len(block)
+    lines = block.count(b"\n") + (0 if block.endswith(b"\n") else 1)
+    kept_lines: list[bytes] = []
+    matched = 0
+    skipped_empty = 0
+    pos = size - len(block.lstrip())
+    validate_first = True
+    while pos < size:
+        if validate_first:
+            hit = pos
+            validate_first = False
+        else:
+            hit = block.find(needle, pos)
+            if escaped_needle is not None:
+                alt = block.find(escaped_needle, pos)
+                if alt >= 0 and (hit < 0 or alt < hit):
+                    hit = alt
+            if hit < 0:
+                break
+        start = block.rfind(b"\n", 0, hit) + 1
+        end = block.find(b"\n", hit)
+        if end < 0:
+            end = size
+        pos = end + 1
+        line = block[start:end]
+        if not line.strip():
+            continue
+        entry = jsonl.loads(line)
+        if (entry.get("language") or entry.get("lang")) != language:
+            continue
+        matched += 1
+        if _entry_has_content(entry):
+            kept_lines.append(line)
+        else:
+            skipped_empty += 1
+    payload = b"\n".join(kept_lines) + b"\n" if kept_lines else b""
+    return payload, lines, matched, len(kept_lines), skipped_empty
+
+
 class KaikkiDownloadError(RuntimeError):
     """Raised when Kaikki resources cannot be downloaded."""
 
@@ -112,6 +291,93 @@ class KaikkiParseError(RuntimeError):
         ]
 
 
+def _read_translation_cache(
+    cache_path: Path,
+    source_mtime: float,
+) -> dict[str, list[str]] | None:
+    """Return the cached translation map when it is at least as new as the dump."""
+    legacy_path = cache_path.with_suffix(".json")  # written by earlier releases
+    if cache_path.exists() and cache_path.stat().st_mtime >= source_mtime:
+        try:
+            with cache_path.open("rb") as fh:
+                # Only ever written by _write_translation_cache, into our own cache directory.
+                mapping = pickle.load(fh)  # noqa: S301
+        except Exception:  # noqa: BLE001  # unpickling a damaged file can raise almost anything
+            return None  # rebuild it
+        return mapping if isinstance(mapping, dict) else None
+    if legacy_path.exists() and legacy_path.stat().st_mtime >= source_mtime:
+        return json.loads(legacy_path.read_text(encoding="utf-8"))
+    return None
+
+
+def _write_translation_cache(cache_path: Path, mapping: dict[str, list[str]]) -> None:
+    """Pickle ``mapping`` to ``cache_path`` so readers never see a partial file."""
+    part_path = cache_path.with_name(f"{cache_path.name}.part")
+    try:
+        with part_path.open("wb") as fh:
+            pickle.dump(mapping, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    os.replace(part_path, cache_path)
+
+
+def _collect_translations(entry: Any, target_lang: str, seen: set[str]) -> None:
+    """Add the ``target_lang`` translation words of ``entry`` to ``seen``."""
+    for sense in entry.get("senses") or ():
+        for tr in sense.get("translations") or ():
+            if tr.get("lang") == target_lang:
+                word = tr.get("word")
+                if word:
+                    seen.add(word)
+
+
+def _scan_translations(source_dump: Path, target_lang: str) -> dict[str, list[str]]:
+    """Map lower-cased headwords of ``source_dump`` to their ``target_lang`` translations."""
+    mapping: dict[str, list[str]] = {}
+    seen: set[str] = set()  # reused for every headword
+    needle, escaped_needle = _language_needles(target_lang)
+    try:
+        with source_dump.open("rb") as fh:
+            for line in fh:
+                # Most headwords carry no translation table, or none into target_lang;
+                # skip them undecoded.
+                if b'"translations"' not in line or (
+                    needle not in line and (escaped_needle is None or escaped_needle not in line)
+                ):
+                    continue
+                try:
+                    entry = jsonl.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                seen.clear()
+                try:
+                    _collect_translations(entry, target_lang, seen)
+                    if seen:
+                        mapping[entry["word"].lower()] = sorted(seen)
+                except (AttributeError, KeyError, TypeError):
+                    continue  # malformed entry shape
+    except OSError as exc:
+        raise KaikkiDownloadError(f"Failed to read Kaikki dump {source_dump}: {exc}") from exc
+    return mapping
+
+
+def _translation_map(
+    source_dump: Path,
+    cache_path: Path,
+    target_lang: str,
+) -> Mapping[str, list[str]]:
+    """Load ``cache_path`` or scan ``source_dump`` for translations into ``target_lang``.
+
+    The result is read-only because callers share it.
+    """
+    mapping = _read_translation_cache(cache_path, source_dump.stat().st_mtime)
+    if mapping is None:
+        mapping = _scan_translations(source_dump, target_lang)
+        _write_translation_cache(cache_path, mapping)
+    return MappingProxyType(mapping)
+
+
 class KaikkiSource(DictionarySource):
     """Access and prepare Kaikki (Wiktextract) datasets."""
 
@@ -127,10 +393,10 @@ class KaikkiSource(DictionarySource):
         self.cache_dir = cache_dir
         self.session = session
         self._progress_factory = progress_factory
-        self._translation_cache: dict[tuple[str, str], dict[str, list[str]]] = {}
+        self._translation_cache: dict[tuple[str, str], Mapping[str, list[str]]] = {}
 
     @property
-    def translation_cache(self) -> dict[tuple[str, str], dict[str, list[str]]]:
+    def translation_cache(self) -> dict[tuple[str, str], Mapping[str, list[str]]]:
         """Expose the in-memory translation cache (primarily for tests)."""
         return self._translation_cache
 
@@ -138,49 +404,78 @@ class KaikkiSource(DictionarySource):
         """Make sure the top-level cache directory hierarchy exists."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def entry_has_content(self, entry: Any) -> bool:  # noqa: C901
-        if not isinstance(entry, dict):
-            return False
-        senses = entry.get("senses")
-        if not isinstance(senses, list) or not senses:
-            return False
-
-        def _iter_values(values: Any) -> list[str]:
-            if isinstance(values, str):
-                return [values]
-            if isinstance(values, list):
-                return [value for value in values if isinstance(value, str)]
-            return []
-
-        for sense in senses:
-            if not isinstance(sense, dict):
-                continue
-            for key in ("glosses", "raw_glosses"):
-                for value in _iter_values(sense.get(key)):
-                    if value.strip():
-                        return True
-        return False
+    def entry_has_content(self, entry: Any) -> bool:
+        return _entry_has_content(entry)
 
     def get_entries(self, in_lang: str, out_lang: str) -> tuple[Path, int]:
         """Entries filtered for the language pair."""
-        language_file, count = self._ensure_filtered_language(in_lang)
+        out_code, _ = lang_meta(out_lang)
+        if out_code == "en":
+            language_file, count = self._ensure_filtered_language(in_lang)
+        else:
+            language_file, count = self._filter_with_pivot_prefetch(in_lang)
         prepared = self._ensure_translated_glosses(language_file, out_lang)
         return prepared, count
 
+    def _filter_with_pivot_prefetch(self, in_lang: str) -> tuple[Path, int]:
+        """Filter ``in_lang`` while the pivot dataset for translated glosses downloads.
+
+        Both steps are network or disk bound. If filtering fails or is interrupted
+        the download is told to stop, and leaving the pool waits at most one
+        ``PREFETCH_TIMEOUT`` read for it.
+        """
+        abort = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pivot = pool.submit(self._prefetch_language_dataset, TRANSLATION_PIVOT, abort)
+            try:
+                result = self._ensure_filtered_language(in_lang)
+            except BaseException:
+                abort.set()
+                raise
+            pivot.result()
+        return result
+
+    def _prefetch_language_dataset(self, language: str, abort: threading.Event) -> Path:
+        """Download ``language`` on a worker thread with a session owned by that thread.
+
+        ``requests.Session`` is not thread-safe, so the prefetch never shares ``self.session``.
+        """
+        with requests.Session() as session:
+            return self._ensure_language_dataset(
+                language,
+                show_progress=False,
+                session=session,
+                timeout=PREFETCH_TIMEOUT,
+                abort=abort,
+            )
+
     def ensure_language_dataset(self, language: str) -> Path:
         """External helper used by tests to warm the per-language Kaikki dump."""
         return self._ensure_language_dataset(language)
 
     def _slugify(self, value: str) -> str:
         """Collapse a language name to a Kaikki/filename friendly slug."""
-        return value.replace(" ", "").replace("-", "").replace("'", "")
+        return _language_slug(value)
 
     def _kaikki_slug(self, language: str) -> str:
         """Mirror Kaikki's slug formatting (spaces/dashes removed)."""
         return self._slugify(language)
 
-    def _ensure_language_dataset(self, language: str) -> Path:
-        """Download (or reuse) the Kaikki JSONL dump dedicated to ``language``."""
+    def _ensure_language_dataset(
+        self,
+        language: str,
+        *,
+        show_progress: bool = True,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = 180,
+        abort: threading.Event | None = None,
+    ) -> Path:
+        """Download (or reuse) the Kaikki JSONL dump dedicated to ``language``.
+
+        Background prefetches pass ``show_progress=False`` because only one live
+        progress display can be active at a time, their own ``session``, a shorter
+        ``timeout``, and an ``abort`` event that cancels the download when set.
+        """
         lang_dir = self.cache_dir / LANGUAGE_CACHE_DIR
         lang_dir.mkdir(parents=True, exist_ok=True)
         slug = self._kaikki_slug(language)
@@ -191,34 +486,20 @@ class KaikkiSource(DictionarySource):
 
         url = LANGUAGE_DUMP_URL.format(lang=quote(language, safe="-"), slug=slug)
         try:
-            response = self.session.get(url, stream=True, timeout=180)
+            response = (session or self.session).get(url, stream=True, timeout=timeout)
             response.raise_for_status()
         except requests.RequestException as exc:
             raise KaikkiDownloadError(
                 f"Failed to download Kaikki dump for {language} from {url}: {exc}",
             ) from exc
 
-        headers = getattr(response, "headers", {}) or {}
-        content_length = headers.get("Content-Length")
-        try:
-            total = int(content_length) if content_length else None
-        except (TypeError, ValueError):  # pragma: no cover - defensive
-            total = None
-
-        with (
-            self._progress_factory(
-                description=f"Downloading {language}",
-                total=total,
-                unit="B",
-            ) as advance,
-            target.open("wb") as fh,
-        ):
-            for chunk in response.iter_content(chunk_size=1 << 20):
-                if not chunk:
-                    continue
-                fh.write(chunk)
-                advance(len(chunk))
-
+        self._save_response(
+            response,
+            target,
+            description=f"Downloading {language}",
+            show_progress=show_progress,
+            abort=abort,
+        )
         return target
 
     def _ensure_raw_dump(self) -> Path:
@@ -237,6 +518,22 @@ class KaikkiSource(DictionarySource):
                 f"Failed to download Kaikki raw dump from {RAW_DUMP_URL}: {exc}",
             ) from exc
 
+        self._save_response(response, target, description="Downloading Kaikki raw dump")
+        return target
+
+    def _save_response(
+        self,
+        response: requests.Response,
+        target: Path,
+        *,
+        description: str,
+        show_progress: bool = True,
+        abort: threading.Event | None = None,
+    ) -> None:
+        """Stream ``response`` into ``target`` in large raw reads, reporting byte progress.
+
+        Setting ``abort`` stops the download between reads and discards the partial file.
+        """
         headers = getattr(response, "headers", {}) or {}
         content_length = headers.get("Content-Length")
         try:
@@ -244,21 +541,27 @@ class KaikkiSource(DictionarySource):
         except (TypeError, ValueError):  # pragma: no cover - defensive
             total = None
 
-        with (
-            self._progress_factory(
-                description="Downloading Kaikki raw dump",
-                total=total,
-                unit="B",
-            ) as advance,
-            target.open("wb") as fh,
-        ):
-            for chunk in response.iter_content(chunk_size=1 << 20):
-                if not chunk:
-                    continue
-                fh.write(chunk)
-                advance(len(chunk))
-
-        return target
+        progress: AbstractContextManager[ProgressAdvance] = (
+            self._progress_factory(description=description, total=total, unit="B")
+            if show_progress
+            else nullcontext(lambda _: None)
+        )
+        raw = response.raw
+        raw.decode_content = True  # undo any Content-Encoding, as iter_content did
+        # Callers treat an existing target as a finished download, so only complete
+        # files are moved into place.
+        part_path = target.with_name(f"{target.name}.part")
+        try:
+            with progress as advance, part_path.open("wb") as fh:
+                while chunk := raw.read(DOWNLOAD_CHUNK_SIZE):
+                    if abort is not None and abort.is_set():
+                        raise KaikkiDownloadError(f"{description} cancelled")
+                    fh.write(chunk)
+                    advance(len(chunk))
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, target)
 
     def _ensure_filtered_language(self, language: str) -> tuple[Path, int]:  # noqa: C901
         """Filter the raw dump down to entries matching ``language`` and cache metadata."""
@@ -290,30 +593,18 @@ class KaikkiSource(DictionarySource):
                 self._progress_factory(
                     description=f"Filtering {language}",
                 ) as advance,
-                gzip.open(raw_dump, "rt", encoding="utf-8") as src,
-                filtered_path.open(
-                    "w",
-                    encoding="utf-8",
-                ) as dst,
+                filtered_path.open("wb") as dst,
             ):
-                for line in src:
-                    if not line.strip():
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError as exc:
-                        raise KaikkiParseError(None, exc) from exc
-
-                    advance(1)
-
-                    entry_language = entry.get("language") or entry.get("lang")
-                    if entry_language == language:
-                        matched += 1
-                        if self.entry_has_content(entry):
-                            dst.write(line if line.endswith("\n") else f"{line}\n")
-                            kept += 1
-                        else:
-                            skipped_empty += 1
+                blocks = _iter_line_blocks(_iter_gunzipped(raw_dump), FILTER_BLOCK_SIZE)
+                results = self._filter_blocks(blocks, language)
+                for payload, lines, block_matched, block_kept, block_skipped in results:
+                    dst.write(payload)
+                    matched += block_matched
+                    kept += block_kept
+                    skipped_empty += block_skipped
+                    advance(lines)
+        except json.JSONDecodeError as exc:
+            raise KaikkiParseError(None, exc) from exc
         except OSError as exc:
             raise KaikkiDownloadError(
                 f"Failed to read Kaikki raw dump from {raw_dump}: {exc}",
@@ -340,6 +631,47 @@ class KaikkiSource(DictionarySource):
 
         return filtered_path, kept
 
+    @staticmethod
+    def _filter_blocks(
+        blocks: Iterator[bytes],
+        language: str,
+    ) -> Iterator[tuple[bytes, int, int, int, int]]:
+        """Run :func:`_filter_block` over ``blocks``, yielding results in input order.
+
+        Once a second block shows up the blocks are spread over worker processes
+        while the caller keeps decompressing; a dump that fits in one block never
+        pays for the pool. At most ``workers + 1`` blocks are in flight so memory
+        stays proportional to the worker count.
+
+        Workers are never forked from this process: the caller may be running a
+        download thread at the same time, and forking a multi-threaded process can
+        deadlock the child.
+        """
+        head = list(itertools.islice(blocks, 2))
+        workers = min(os.cpu_count() or 1, FILTER_MAX_WORKERS)
+        if len(head) <= 1 or workers <= 1:
+            for block in itertools.chain(head, blocks):
+                yield _filter_block(block, language)
+            return
+
+        start_method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+        pending: deque[Future[tuple[bytes, int, int, int, int]]] = deque()
+        try:
+            for block in itertools.chain(head, blocks):
+                pending.append(pool.submit(_filter_block, block, language))
+                if len(pending) > workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
     def get_filter_stats(self, language: str) -> dict[str, int] | None:
         """Return cached filtering statistics for ``language`` when available."""
         stats = super().get_filter_stats(language)
@@ -356,7 +688,11 @@ class KaikkiSource(DictionarySource):
         self.record_filter_stats(language, meta)
         return super().get_filter_stats(language)
 
-    def _load_translation_map(self, source_lang: str, target_lang: str) -> dict[str, list[str]]:
+    def _load_translation_map(
+        self,
+        source_lang: str,
+        target_lang: str,
+    ) -> Mapping[str, list[str]]:
         """Build or reuse a map from source words to translations in ``target_lang``."""
         key = (source_lang.lower(), target_lang.lower())
         cached = self._translation_cache.get(key)
@@ -368,72 +704,89 @@ class KaikkiSource(DictionarySource):
 
         source_slug = self._kaikki_slug(source_lang)
         target_slug = self._kaikki_slug(target_lang)
-        cache_path = cache_dir / f"{source_slug}_to_{target_slug}.json"
+        cache_path = cache_dir / f"{source_slug}_to_{target_slug}.pickle"
 
         source_dump = self._ensure_language_dataset(source_lang)
-        if cache_path.exists() and cache_path.stat().st_mtime >= source_dump.stat().st_mtime:
-            data = json.loads(cache_path.read_text(encoding="utf-8"))
-            self._translation_cache[key] = {k: list(v) for k, v in data.items()}
-            return self._translation_cache[key]
-
-        mapping: dict[str, list[str]] = {}
-        try:
-            with source_dump.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    translations = {
-                        tr["word"]
-                        for sense in entry.get("senses", [])
-                        for tr in sense.get("translations") or []
-                        if tr.get("lang") == target_lang and tr.get("word")
-                    }
-                    if translations:
-                        mapping[entry["word"].lower()] = sorted(translations)
-        except OSError as exc:
-            raise KaikkiDownloadError(
-                f"Failed to read Kaikki dump for {source_lang}: {exc}",
-            ) from exc
-
-        cache_path.write_text(
-            json.dumps(mapping, ensure_ascii=False, sort_keys=True),
-            encoding="utf-8",
-        )
+        mapping = _translation_map(source_dump, cache_path, target_lang)
         self._translation_cache[key] = mapping
         return mapping
 
-    def _apply_translation_glosses(  # noqa: C901
+    @staticmethod
+    def _link_translations(
+        links: list[Any] | None,
+        translation_map: Mapping[str, list[str]],
+        known: AbstractSet[str],
+    ) -> list[str]:
+        """Translate the pivot words that a sense links to."""
+        translations: list[str] = []
+        if not links:
+            return translations
+        for link in links:
+            # Entries come straight from JSON, so sequences are always lists.
+            if type(link) is not list or not link:
+                continue
+            pivot = link[0]
+            if type(pivot) is str:
+                key = pivot.lower()
+                if key in known:
+                    translations.extend(translation_map[key])
+        return translations
+
+    @staticmethod
+    def _gloss_translations(
+        glosses: list[Any] | None,
+        translation_map: Mapping[str, list[str]],
+        known: AbstractSet[str],
+    ) -> list[str]:
+        """Translate glosses that are themselves pivot headwords."""
+        translations: list[str] = []
+        if not glosses:
+            return translations
+        for gloss in glosses:
+            if type(gloss) is not str:
+                continue
+            candidate = gloss.lower()
+            if candidate not in known:
+                # Fall back to the head of the gloss: "house; home (building)" -> "house".
+                candidate = candidate.partition(";")[0].partition("(")[0].strip()
+                if candidate not in known:
+                    continue
+            translations.extend(translation_map[candidate])
+        return translations
+
+    def _apply_translation_glosses(
         self,
         entry: dict[str, Any],
-        translation_map: dict[str, list[str]],
-    ) -> None:
-        """Mutate ``entry`` so glosses prefer translated variants when available."""
-        senses = entry.get("senses") or []
+        translation_map: Mapping[str, list[str]],
+        known_words: AbstractSet[str] | None = None,
+    ) -> bool:
+        """Mutate ``entry`` so glosses prefer translated variants when available.
+
+        ``known_words`` is the key set of ``translation_map``; callers handling many
+        entries pass a prebuilt frozenset so the (mostly missing) lookups are plain
+        set probes instead of calls through the read-only mapping proxy.
+
+        Returns True when at least one sense was rewritten.
+        """
+        senses = entry.get("senses")
+        if not senses:
+            return False
+        changed = False
+        known = translation_map.keys() if known_words is None else known_words
         for sense in senses:
-            translations: set[str] = set()
-            for link in sense.get("links") or []:
-                if not isinstance(link, (list, tuple)) or not link:
-                    continue
-                pivot = link[0]
-                if isinstance(pivot, str):
-                    translations.update(translation_map.get(pivot.lower(), []))
+            translations = self._link_translations(sense.get("links"), translation_map, known)
             if not translations:
-                for gloss in sense.get("glosses") or []:
-                    if not isinstance(gloss, str):
-                        continue
-                    candidate = gloss.lower()
-                    if candidate in translation_map:
-                        translations.update(translation_map[candidate])
-                        continue
-                    stripped = candidate.split(";", 1)[0].split("(", 1)[0].strip()
-                    if stripped in translation_map:
-                        translations.update(translation_map[stripped])
+                translations = self._gloss_translations(
+                    sense.get("glosses"),
+                    translation_map,
+                    known,
+                )
             if translations:
                 ordered = sorted(set(translations))
                 sense["glosses"] = ordered
                 sense["raw_glosses"] = ordered
+                changed = True
+        return changed
 
     def _ensure_translated_glosses(
         self,
@@ -445,19 +798,25 @@ class KaikkiSource(DictionarySource):
         if out_code == "en":
             return base_path
 
-        translation_map = self._load_translation_map("English", out_lang)
+        translation_map = self._load_translation_map(TRANSLATION_PIVOT, out_lang)
         localized = base_path.with_name(f"{base_path.stem}__to_{out_code}.jsonl")
         if localized.exists() and localized.stat().st_mtime >= base_path.stat().st_mtime:
             return localized
+        known_words = frozenset(translation_map)
         with (
-            base_path.open("r", encoding="utf-8") as src,
-            localized.open("w", encoding="utf-8") as dst,
+            base_path.open("rb") as src,
+            localized.open("wb") as dst,
         ):
             for line in src:
+                if not line.strip():
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = jsonl.loads(line)
                 except json.JSONDecodeError:
                     continue
-                self._apply_translation_glosses(entry, translation_map)
-                dst.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                if self._apply_translation_glosses(entry, translation_map, known_words):
+                    dst.write(jsonl.dumps_line(entry))
+                else:
+                    # Untouched entries keep their original bytes.
+                    dst.write(line if line.endswith(b"\n") else line + b"\n")
         return localized
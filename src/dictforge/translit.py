@@ -1,6 +1,7 @@
 """Serbian Cyrillic/Latin transliteration."""
 
 import unicodedata
+from functools import lru_cache
 
 _PAIR = {
     "dj": "ђ",
@@ -75,23 +76,22 @@ def lat_to_cyr(text: str) -> str:
     return "".join(chars)
 
 
+def _build_cyr_to_lat_table() -> dict[int, str]:
+    table: dict[int, str] = {}
+    for cyr, lat in _CYR_TO_LAT.items():
+        table[ord(cyr)] = lat
+        upper = cyr.upper()
+        # Digraph letters are title-cased on their own: Љубав -> Ljubav.
+        table[ord(upper)] = lat.capitalize() if cyr in {"љ", "њ", "џ"} else lat.upper()
+    return table
+
+
+_CYR_TO_LAT_TABLE = _build_cyr_to_lat_table()
+
+
+@lru_cache(maxsize=65536)
 def cyr_to_lat(text: str) -> str:
-    normalized = unicodedata.normalize("NFC", text)
-    result: list[str] = []
-    for letter in normalized:
-        lower = letter.lower()
-        base = _CYR_TO_LAT.get(lower)
-        if base is None:
-            result.append(letter)
-            continue
-        if letter.isupper():
-            if lower in {"љ", "њ", "џ"}:
-                result.append(base.capitalize())
-            else:
-                result.append(base.upper())
-        else:
-            result.append(base)
-    return "".join(result)
+    return unicodedata.normalize("NFC", text).translate(_CYR_TO_LAT_TABLE)
 
 
 __all__ = ["lat_to_cyr", "cyr_to_lat"]
@@ -1,11 +1,14 @@
 import gzip
 import json
 import io
+import pickle
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
+import requests
 
 from dictforge.builder import (
     Builder,
@@ -14,6 +17,7 @@ from dictforge.builder import (
     KindleBuildError,
     get_available_formats,
 )
+from dictforge import export_mobi, source_kaikki
 from dictforge.kindle import kindle_lang_code
 from dictforge.source_base import DictionarySource
 from dictforge.source_kaikki import KaikkiSource, META_SUFFIX
@@ -21,6 +25,25 @@ from dictforge.export_mobi import MobiExportFormat
 from dictforge.export_stardict import StarDictExportFormat
 from rich.console import Console
 
+# JSONL fixture lines shared by several tests, serialised once at import.
+_SERBIAN_STORY_LINE = (
+    json.dumps({"language": "Serbian", "word": "priča", "senses": [{"glosses": ["story"]}]}) + "\n"
+)
+_SERBIAN_EMPTY_LINE = (
+    json.dumps(
+        {
+            "language": "Serbian",
+            "word": "prazan",
+            "senses": [{"glosses": ["  "], "raw_glosses": [""]}],
+        },
+    )
+    + "\n"
+)
+_ENGLISH_STORY_LINE = (
+    json.dumps({"language": "English", "word": "story", "senses": [{"glosses": ["tale"]}]}) + "\n"
+)
+_HELLO_LINKS_LINE = json.dumps({"senses": [{"links": [["Hello"]]}]}) + "\n"
+
 
 @pytest.fixture
 def builder(tmp_path: Path) -> Builder:
@@ -87,18 +110,23 @@ def test_ensure_language_dataset_uses_cached_file(
     assert path == cached
 
 
+@pytest.mark.parametrize(
+    "payload",
+    [b"line1line2", b"x" * (1 << 20)],
+    ids=["short", "several-reads"],
+)
 def test_ensure_language_dataset_downloads_when_missing(
-    kaikki_source: KaikkiSource, monkeypatch
+    kaikki_source: KaikkiSource, monkeypatch, payload: bytes
 ) -> None:
-    chunks = [b"line1", b"line2"]
+    # A smaller read size makes the 1 MiB payload span several raw reads.
+    monkeypatch.setattr(source_kaikki, "DOWNLOAD_CHUNK_SIZE", 1 << 16)
 
     class DummyResponse:
+        raw = io.BytesIO(payload)
+
         def raise_for_status(self) -> None:  # pragma: no cover - simple no-op
             return
 
-        def iter_content(self, chunk_size: int):
-            yield from chunks
-
     monkeypatch.setattr(
         kaikki_source.session,
         "get",
@@ -107,7 +135,33 @@ def test_ensure_language_dataset_downloads_when_missing(
 
     path = kaikki_source.ensure_language_dataset("Serbian")
     assert path.exists()
-    assert path.read_bytes() == b"".join(chunks)
+    assert path.read_bytes() == payload
+    assert not list(path.parent.glob("*.part"))
+
+
+def test_ensure_language_dataset_discards_partial_download(
+    kaikki_source: KaikkiSource, monkeypatch
+) -> None:
+    class BrokenStream(io.BytesIO):
+        def read(self, size: int = -1) -> bytes:
+            raise OSError("connection reset")
+
+    class DummyResponse:
+        raw = BrokenStream()
+
+        def raise_for_status(self) -> None:  # pragma: no cover - simple no-op
+            return
+
+    monkeypatch.setattr(
+        kaikki_source.session,
+        "get",
+        lambda url, stream, timeout: DummyResponse(),
+    )
+
+    with pytest.raises(OSError, match="connection reset"):
+        kaikki_source.ensure_language_dataset("Serbian")
+    lang_dir = kaikki_source.cache_dir / "languages"
+    assert not list(lang_dir.iterdir())
 
 
 def test_load_translation_map_reads_dump(
@@ -148,7 +202,27 @@ def test_load_translation_map_reads_dump(
 
     mapping = kaikki_source._load_translation_map("English", "Serbian")
     assert mapping == {"house": ["kuća", "дом"]}
-    assert kaikki_source.translation_cache[("english", "serbian")] is mapping
+    assert kaikki_source._load_translation_map("English", "Serbian") is mapping
+    with pytest.raises(TypeError):
+        mapping["new"] = []  # type: ignore[index]
+
+    assert kaikki_source.translation_cache == {("english", "serbian"): mapping}
+    kaikki_source.translation_cache.clear()
+    assert kaikki_source._load_translation_map("English", "Serbian") == mapping
+    assert (tmp_path / "translations" / "English_to_Serbian.pickle").exists()
+    assert not list((tmp_path / "translations").glob("*.part"))
+
+
+@pytest.mark.parametrize(
+    "cache_bytes",
+    [b"", b"garbage", pickle.dumps(["not", "a", "dict"])],
+    ids=["empty", "garbage", "wrong-type"],
+)
+def test_read_translation_cache_rejects_damaged_file(tmp_path: Path, cache_bytes: bytes) -> None:
+    cache_path = tmp_path / "English_to_Serbian.pickle"
+    cache_path.write_bytes(cache_bytes)
+
+    assert source_kaikki._read_translation_cache(cache_path, 0) is None
 
 
 def test_apply_translation_glosses(kaikki_source: KaikkiSource) -> None:
@@ -177,12 +251,91 @@ def test_apply_translation_glosses(kaikki_source: KaikkiSource) -> None:
     assert second["raw_glosses"] == ["saludo"]
 
 
+def test_get_entries_prefetches_pivot_dataset(
+    kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path
+) -> None:
+    filtered = tmp_path / "Serbian.jsonl"
+    requested: list[tuple[str, bool]] = []
+
+    def fake_dataset(language: str, *, show_progress: bool = True, **_: object) -> Path:
+        requested.append((language, show_progress))
+        return tmp_path / "English.jsonl"
+
+    monkeypatch.setattr(kaikki_source, "_ensure_language_dataset", fake_dataset)
+    monkeypatch.setattr(kaikki_source, "_ensure_filtered_language", lambda language: (filtered, 3))
+    monkeypatch.setattr(
+        kaikki_source,
+        "_ensure_translated_glosses",
+        lambda base_path, out_lang: base_path.with_name(f"{base_path.stem}__to_ru.jsonl"),
+    )
+
+    path, count = kaikki_source.get_entries("Serbian", "Russian")
+
+    assert path == tmp_path / "Serbian__to_ru.jsonl"
+    assert count == 3
+    assert requested == [("English", False)]
+
+
+def test_get_entries_stops_pivot_prefetch_when_filtering_fails(
+    kaikki_source: KaikkiSource, monkeypatch
+) -> None:
+    started = threading.Event()
+    seen: dict[str, object] = {}
+
+    def slow_dataset(
+        language: str,
+        *,
+        show_progress: bool = True,
+        session: requests.Session | None = None,
+        timeout: float | tuple[float, float] = 180,
+        abort: threading.Event | None = None,
+    ) -> Path:
+        seen["session"] = session
+        seen["timeout"] = timeout
+        started.set()
+        assert abort is not None
+        seen["aborted"] = abort.wait(timeout=5)
+        raise source_kaikki.KaikkiDownloadError("cancelled")
+
+    def failing_filter(language: str) -> tuple[Path, int]:
+        started.wait(timeout=5)
+        raise KaikkiDownloadError("raw dump unavailable")
+
+    monkeypatch.setattr(kaikki_source, "_ensure_language_dataset", slow_dataset)
+    monkeypatch.setattr(kaikki_source, "_ensure_filtered_language", failing_filter)
+
+    with pytest.raises(KaikkiDownloadError, match="raw dump unavailable"):
+        kaikki_source.get_entries("Serbian", "Russian")
+
+    # The worker has finished by the time get_entries returns.
+    assert seen["aborted"] is True
+    assert seen["session"] is not kaikki_source.session
+    assert seen["timeout"] == source_kaikki.PREFETCH_TIMEOUT
+
+
+def test_save_response_stops_when_aborted(kaikki_source: KaikkiSource, tmp_path: Path) -> None:
+    abort = threading.Event()
+    abort.set()
+    target = tmp_path / "English.jsonl"
+
+    with pytest.raises(KaikkiDownloadError, match="cancelled"):
+        kaikki_source._save_response(
+            SimpleNamespace(raw=io.BytesIO(b"data"), headers={}),
+            target,
+            description="Downloading English",
+            show_progress=False,
+            abort=abort,
+        )
+    assert not target.exists()
+    assert not list(tmp_path.glob("*.part"))
+
+
 def test_ensure_translated_glosses_reuses_cache(
     kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path
 ) -> None:
     base_path = tmp_path / "Serbian-English.jsonl"
     base_path.write_text(
-        json.dumps({"senses": [{"links": [["Hello"]]}]}) + "\n",
+        _HELLO_LINKS_LINE,
         encoding="utf-8",
     )
 
@@ -204,11 +357,38 @@ def test_ensure_translated_glosses_reuses_cache(
     assert localized == localized_path
 
 
+def test_ensure_translated_glosses_copies_unmatched_lines(
+    kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path
+) -> None:
+    base_path = tmp_path / "Serbian-English.jsonl"
+    untouched = '{"word": "mačka",  "senses": [{"glosses": ["cat"]}]}'
+    base_path.write_text(
+        _HELLO_LINKS_LINE + "\n<html>oops</html>\n" + untouched + "\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(
+        kaikki_source,
+        "_load_translation_map",
+        lambda source, target: {"hello": ["здраво"]},
+    )
+
+    localized = kaikki_source._ensure_translated_glosses(base_path, "Russian")
+
+    # Blank and non-JSON lines are dropped so the output stays valid JSONL.
+
+    translated, copied = localized.read_text(encoding="utf-8").splitlines()
+    assert json.loads(translated)["senses"][0]["glosses"] == ["здраво"]
+    assert copied == untouched
+
+
+def _read_jsonl(path: Path) -> list[Any]:
+    with path.open("rb") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
 def _create_raw_dump(path: Path, lines: list[str]) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with gzip.open(path, "wt", encoding="utf-8") as fh:
-        for line in lines:
-            fh.write(line)
+    path.write_bytes(gzip.compress("".join(lines).encode("utf-8"), compresslevel=1))
     return path
 
 
@@ -242,30 +422,9 @@ def test_ensure_filtered_language_filters_and_caches(
     _create_raw_dump(
         raw_path,
         [
-            json.dumps(
-                {
-                    "language": "Serbian",
-                    "word": "priča",
-                    "senses": [{"glosses": ["story"]}],
-                },
-            )
-            + "\n",
-            json.dumps(
-                {
-                    "language": "Serbian",
-                    "word": "prazan",
-                    "senses": [{"glosses": ["  "], "raw_glosses": [""]}],
-                },
-            )
-            + "\n",
-            json.dumps(
-                {
-                    "language": "English",
-                    "word": "story",
-                    "senses": [{"glosses": ["tale"]}],
-                },
-            )
-            + "\n",
+            _SERBIAN_STORY_LINE,
+            _SERBIAN_EMPTY_LINE,
+            _ENGLISH_STORY_LINE,
         ],
     )
 
@@ -273,7 +432,7 @@ def test_ensure_filtered_language_filters_and_caches(
 
     filtered_path, count = kaikki_source._ensure_filtered_language("Serbian")
     assert count == 1
-    entries = [json.loads(line) for line in filtered_path.read_text(encoding="utf-8").splitlines()]
+    entries = _read_jsonl(filtered_path)
     assert {entry["word"] for entry in entries} == {"priča"}
 
     meta_path = filtered_path.parent / f"{filtered_path.stem}{META_SUFFIX}"
@@ -294,22 +453,8 @@ def test_get_filter_stats_returns_meta(
     _create_raw_dump(
         raw_path,
         [
-            json.dumps(
-                {
-                    "language": "Serbian",
-                    "word": "priča",
-                    "senses": [{"glosses": ["story"]}],
-                },
-            )
-            + "\n",
-            json.dumps(
-                {
-                    "language": "Serbian",
-                    "word": "prazan",
-                    "senses": [{"glosses": ["  "], "raw_glosses": [""]}],
-                },
-            )
-            + "\n",
+            _SERBIAN_STORY_LINE,
+            _SERBIAN_EMPTY_LINE,
         ],
     )
 
@@ -325,6 +470,47 @@ def test_get_filter_stats_returns_meta(
     assert stats_from_disk == {"count": 1, "matched_entries": 2, "skipped_empty": 1}
 
 
+def test_ensure_filtered_language_parallel_blocks_keep_order(
+    kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path
+) -> None:
+    raw_path = tmp_path / "raw" / "dump.jsonl.gz"
+    _create_raw_dump(
+        raw_path,
+        [
+            json.dumps(
+                {
+                    "language": "Serbian" if index % 3 == 0 else "English",
+                    "word": f"w{index}",
+                    "senses": [{"glosses": ["gloss"]}],
+                },
+            )
+            + "\n"
+            for index in range(200)
+        ],
+    )
+    monkeypatch.setattr(kaikki_source, "_ensure_raw_dump", lambda: raw_path)
+    monkeypatch.setattr(source_kaikki, "FILTER_BLOCK_SIZE", 256)
+    # Force the worker pool even on single-core CI runners.
+    monkeypatch.setattr(source_kaikki.os, "cpu_count", lambda: 2)
+
+    filtered_path, count = kaikki_source._ensure_filtered_language("Serbian")
+
+    words = [entry["word"] for entry in _read_jsonl(filtered_path)]
+    assert words == [f"w{index}" for index in range(0, 200, 3)]
+    assert count == len(words)
+
+
+@pytest.mark.parametrize("read_size", [4, 1 << 16])
+def test_iter_gunzipped_accepts_trailing_nul_padding(tmp_path: Path, read_size: int) -> None:
+    dump = tmp_path / "padded.jsonl.gz"
+    # Two members followed by block padding, as left by tape or dd copies.
+    dump.write_bytes(gzip.compress(b"first\n") + gzip.compress(b"second\n") + b"\0" * 512)
+
+    data = b"".join(source_kaikki._iter_gunzipped(dump, read_size))
+
+    assert data == gzip.decompress(dump.read_bytes()) == b"first\nsecond\n"
+
+
 def test_ensure_filtered_language_invalid_json(
     kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path
 ) -> None:
@@ -336,6 +522,22 @@ def test_ensure_filtered_language_invalid_json(
         kaikki_source._ensure_filtered_language("Serbian")
 
 
+@pytest.mark.parametrize(
+    "corrupt_line",
+    ['{"language": "English", "word": "cut', "<html>Service Unavailable</html>"],
+)
+def test_ensure_filtered_language_rejects_corrupt_unmatched_line(
+    kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path, corrupt_line: str
+) -> None:
+    raw_path = tmp_path / "raw" / "dump.jsonl.gz"
+    entry = {"language": "Serbian", "word": "reč", "senses": [{"glosses": ["word"]}]}
+    _create_raw_dump(raw_path, [json.dumps(entry) + "\n", corrupt_line + "\n"])
+    monkeypatch.setattr(kaikki_source, "_ensure_raw_dump", lambda: raw_path)
+
+    with pytest.raises(KaikkiParseError):
+        kaikki_source._ensure_filtered_language("Serbian")
+
+
 def test_ensure_filtered_language_without_matches(
     kaikki_source: KaikkiSource, monkeypatch, tmp_path: Path
 ) -> None:
@@ -369,11 +571,7 @@ def test_prepare_combined_entries_merges_sources(tmp_path: Path) -> None:
 
     combined_path, count = builder._prepare_combined_entries("Serbian", "English")
     assert count == 1
-    merged = [
-        json.loads(line)
-        for line in combined_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+    merged = _read_jsonl(combined_path)
     merged_by_word = {entry["word"]: entry for entry in merged}
     examples = merged_by_word["test"]["senses"][0]["examples"]
     assert {"text": "one"} in examples
@@ -381,6 +579,19 @@ def test_prepare_combined_entries_merges_sources(tmp_path: Path) -> None:
     assert "second" not in merged_by_word
 
 
+def test_prepare_combined_entries_rejects_corrupt_line(tmp_path: Path) -> None:
+    source_dir = tmp_path / "sources"
+    entry = {"word": "test", "senses": [{"glosses": ["gloss"]}]}
+    source_one = DummySource(source_dir, "s1", [entry])
+    source_two = DummySource(source_dir, "s2", [entry])
+    with source_two.path.open("a", encoding="utf-8") as fh:
+        fh.write("\n<html>truncated\n")
+    builder = Builder(tmp_path / "cache", show_progress=False, sources=[source_one, source_two])
+
+    with pytest.raises(KaikkiParseError):
+        builder._prepare_combined_entries("Serbian", "English")
+
+
 def test_builder_logs_skipped_entries(tmp_path: Path, monkeypatch) -> None:
     cache_dir = tmp_path / "cache"
     builder = Builder(cache_dir, show_progress=False)
@@ -389,25 +600,14 @@ def test_builder_logs_skipped_entries(tmp_path: Path, monkeypatch) -> None:
     _create_raw_dump(
         raw_path,
         [
-            json.dumps(
-                {
-                    "language": "Serbian",
-                    "word": "priča",
-                    "senses": [{"glosses": ["story"]}],
-                },
-            )
-            + "\n",
-            json.dumps(
-                {
-                    "language": "Serbian",
-                    "word": "prazan",
-                    "senses": [{"glosses": ["  "], "raw_glosses": [""]}],
-                },
-            )
-            + "\n",
+            _SERBIAN_STORY_LINE,
+            _SERBIAN_EMPTY_LINE,
         ],
     )
     monkeypatch.setattr(kaikki_source, "_ensure_raw_dump", lambda: raw_path)
+    # Keep the FreeDict source offline; it would otherwise probe freedict.org.
+    freedict_source = builder._sources[1]
+    monkeypatch.setattr(freedict_source, "get_entries", freedict_source._create_empty_result)
 
     buffer = io.StringIO()
     builder._console = Console(file=buffer, force_terminal=False, color_system=None)
@@ -440,12 +640,8 @@ def test_kindle_lang_code_variants() -> None:
         kindle_lang_code("sr", override="unsupported")
 
 
-def test_ensure_opf_languages_updates_metadata(
-    mobi_exporter: MobiExportFormat, tmp_path: Path
-) -> None:
-    opf_path = tmp_path / "content.opf"
-    opf_path.write_text(
-        """
+# Minimal OPF carrying only legacy dc-metadata language tags.
+_LEGACY_OPF = """
 <package xmlns="http://www.idpf.org/2007/opf" xmlns:dc="http://purl.org/dc/elements/1.1/">
   <metadata>
     <dc:title>Old Title</dc:title>
@@ -458,9 +654,14 @@ def test_ensure_opf_languages_updates_metadata(
     </opf:x-metadata>
   </metadata>
 </package>
-""".strip(),
-        encoding="utf-8",
-    )
+""".strip()
+
+
+def test_ensure_opf_languages_updates_metadata(
+    mobi_exporter: MobiExportFormat, tmp_path: Path
+) -> None:
+    opf_path = tmp_path / "content.opf"
+    opf_path.write_text(_LEGACY_OPF, encoding="utf-8")
 
     mobi_exporter._ensure_opf_languages(opf_path, "sr", "en-us", "New Title")
 
@@ -490,6 +691,13 @@ def test_run_kindlegen_failure(mobi_exporter: MobiExportFormat, monkeypatch) ->
     assert "err" in str(exc.value)
 
 
+_EMPTY_OPF = """
+<package xmlns="http://www.idpf.org/2007/opf" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <metadata />
+</package>
+""".strip()
+
+
 class DummyCreator:
     def __init__(self, in_lang: str, out_lang: str, kaikki_file_path: str) -> None:
         self.in_lang = in_lang
@@ -512,29 +720,18 @@ class DummyCreator:
         mobi_temp_folder_path: str,
         mobi_output_file_path: str,
     ) -> None:
-        temp_dir = Path(mobi_temp_folder_path)
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        oebps = temp_dir / "OEBPS"
-        oebps.mkdir(exist_ok=True)
-        opf = oebps / "content.opf"
-        opf.write_text(
-            """
-<package xmlns="http://www.idpf.org/2007/opf" xmlns:dc="http://purl.org/dc/elements/1.1/">
-  <metadata />
-</package>
-""".strip(),
-            encoding="utf-8",
-        )
-
         if kindlegen_path == "trigger-fallback":
+            # Only the fallback path reads the build tree back, so only it gets one.
+            oebps = Path(mobi_temp_folder_path) / "OEBPS"
+            oebps.mkdir(parents=True, exist_ok=True)
+            (oebps / "content.opf").write_text(_EMPTY_OPF, encoding="utf-8")
             raise FileNotFoundError("kindlegen not found")
 
-        (oebps / "content.mobi").write_bytes(b"mobi")
         self.mobi_path = mobi_output_file_path
 
 
 def test_export_one_success(builder: Builder, monkeypatch, tmp_path: Path) -> None:
-    monkeypatch.setattr("dictforge.export_mobi.DictionaryCreator", DummyCreator)
+    monkeypatch.setattr(export_mobi, "DictionaryCreator", DummyCreator)
     lang_file = tmp_path / "l.jsonl"
     lang_file.write_text("{}\n", encoding="utf-8")
 
@@ -558,7 +755,7 @@ def test_export_one_success(builder: Builder, monkeypatch, tmp_path: Path) -> No
 def test_export_one_fallback_runs_kindlegen(
     mobi_exporter: MobiExportFormat, monkeypatch, tmp_path: Path
 ) -> None:
-    monkeypatch.setattr("dictforge.export_mobi.DictionaryCreator", DummyCreator)
+    monkeypatch.setattr(export_mobi, "DictionaryCreator", DummyCreator)
     base_file = tmp_path / "base.jsonl"
     base_file.write_text("{}\n", encoding="utf-8")
 
@@ -35,12 +35,7 @@ class RecordingCreator:
         mobi_temp_folder_path: str,
         mobi_output_file_path: str,
     ) -> None:
-        temp_dir = Path(mobi_temp_folder_path)
-        oebps = temp_dir / "OEBPS"
-        oebps.mkdir(parents=True, exist_ok=True)
-        # Minimal OPF payload so Builder's success path runs without fallback.
-        (oebps / "content.opf").write_text("<package></package>", encoding="utf-8")
-        (oebps / "content.mobi").write_bytes(b"mobi")
+        # The exporter's success path never reads the temp folder, so nothing is written.
         self.export_args = {
             "kindlegen_path": kindlegen_path,
             "try_fix": try_to_fix_failed_inflections,
@@ -143,8 +138,7 @@ def test_cli_filters_and_invokes_kindlegen(monkeypatch, tmp_path: Path) -> None:
     assert "filtered" in creator.kaikki_file_path.parts
 
     filtered_entries = [
-        json.loads(line)
-        for line in creator.kaikki_file_path.read_text(encoding="utf-8").splitlines()
+        json.loads(chunk) for chunk in creator.kaikki_file_path.read_bytes().split(b"\n") if chunk
     ]
     filtered_words = {entry["word"] for entry in filtered_entries}
     assert filtered_words == {"priča", "brod"}
@@ -7,8 +7,7 @@ def _mock_exists(target: str):
     normalized_target = target.replace("\\", "/")
 
     def _inner(self: Path) -> bool:
-        actual = getattr(self, "as_posix", lambda: str(self))()
-        return actual.replace("\\", "/") == normalized_target
+        return self.as_posix().replace("\\", "/") == normalized_target
 
     return _inner
 
@@ -1,29 +1,54 @@
+import os
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from dictforge import __version__
+from dictforge import __version__, main
 from dictforge.builder import KaikkiDownloadError, KindleBuildError
 from dictforge.kindle import kindle_lang_code
 from dictforge.main import cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
+    # CliRunner keeps no state between invoke() calls, so one instance serves every test.
     return CliRunner()
 
 
+_BASE_CONFIG: dict[str, object] = {
+    "default_out_lang": "English",
+    "merge_in_langs": "Croatian",
+    "include_pos": False,
+    "try_fix_inflections": False,
+    "kindlegen_path": "",
+    "enable_freedict": True,
+}
+
+
 def _base_config(tmp_path: Path) -> dict[str, object]:
-    return {
-        "default_out_lang": "English",
-        "merge_in_langs": "Croatian",
-        "include_pos": False,
-        "try_fix_inflections": False,
-        "cache_dir": str(tmp_path / "cache"),
-        "kindlegen_path": "",
-        "enable_freedict": True,
-    }
+    return {**_BASE_CONFIG, "cache_dir": os.fspath(tmp_path / "cache")}
+
+
+@pytest.fixture
+def patched_main(monkeypatch, tmp_path: Path) -> dict[str, object]:
+    """Point the CLI at a temp config, a detected kindlegen and fixed Serbian defaults."""
+    config = _base_config(tmp_path)
+    monkeypatch.setattr(main, "load_config", lambda: config)
+    monkeypatch.setattr(main, "guess_kindlegen_path", lambda: "/usr/bin/kindlegen")
+    monkeypatch.setattr(
+        main,
+        "make_defaults",
+        lambda *_: {
+            "title": "Title",
+            "shortname": "Short",
+            "outdir": str(tmp_path / "out"),
+            "in_code": "sr",
+            "out_code": "en",
+        },
+    )
+    return config
 
 
 def test_version() -> None:
@@ -36,31 +61,15 @@ def test_version_option(runner: CliRunner) -> None:
     assert __version__ in result.output
 
 
-def test_cli_requires_input_language(runner: CliRunner) -> None:
-    result = runner.invoke(cli, [])
-    assert result.exit_code != 0
-    assert "Input language is required" in result.output
+def test_cli_requires_input_language() -> None:
+    # The check runs in the callback itself, so no output capture is needed.
+    with pytest.raises(click.UsageError, match="Input language is required"):
+        cli.main([], standalone_mode=False)
 
 
-def test_cli_success_path(monkeypatch, runner: CliRunner, tmp_path: Path) -> None:
-    config = _base_config(tmp_path)
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config)
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "/usr/bin/kindlegen")
-    monkeypatch.setattr(
-        "dictforge.main.make_defaults",
-        lambda in_lang, out_lang: {
-            "title": "Title",
-            "shortname": "Short",
-            "outdir": str(tmp_path / "out"),
-            "in_code": "sr",
-            "out_code": "en",
-        },
-    )
-
+def test_cli_success_path(monkeypatch, patched_main, runner: CliRunner, tmp_path: Path) -> None:
     calls: dict[str, object] = {}
 
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "/usr/bin/kindlegen")
-
     class DummyBuilder:
         def __init__(
             self,
@@ -82,7 +91,7 @@ def test_cli_success_path(monkeypatch, runner: CliRunner, tmp_path: Path) -> Non
             calls["build_kwargs"] = kwargs
             return {"Serbo-Croatian": 5, "Croatian": 2}
 
-    monkeypatch.setattr("dictforge.main.Builder", DummyBuilder)
+    monkeypatch.setattr(main, "Builder", DummyBuilder)
 
     result = runner.invoke(cli, ["sr"])
 
@@ -100,21 +109,7 @@ def test_cli_success_path(monkeypatch, runner: CliRunner, tmp_path: Path) -> Non
     assert build_kwargs["export_options"]["kindlegen_path"] == "/usr/bin/kindlegen"
 
 
-def test_cli_reset_cache_triggers_cleanup(monkeypatch, runner: CliRunner, tmp_path: Path) -> None:
-    config = _base_config(tmp_path)
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config)
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "/usr/bin/kindlegen")
-    monkeypatch.setattr(
-        "dictforge.main.make_defaults",
-        lambda *_: {
-            "title": "Title",
-            "shortname": "Short",
-            "outdir": str(tmp_path / "out"),
-            "in_code": "sr",
-            "out_code": "en",
-        },
-    )
-
+def test_cli_reset_cache_triggers_cleanup(monkeypatch, patched_main, runner: CliRunner) -> None:
     calls: dict[str, object] = {}
 
     class DummyBuilder:
@@ -137,7 +132,7 @@ def test_cli_reset_cache_triggers_cleanup(monkeypatch, runner: CliRunner, tmp_pa
         def build_dictionary(self, **_: object) -> dict[str, int]:  # pragma: no cover - simple stub
             return {"Serbo-Croatian": 5}
 
-    monkeypatch.setattr("dictforge.main.Builder", DummyBuilder)
+    monkeypatch.setattr(main, "Builder", DummyBuilder)
 
     result = runner.invoke(cli, ["--reset-cache", "sr"])
 
@@ -145,22 +140,8 @@ def test_cli_reset_cache_triggers_cleanup(monkeypatch, runner: CliRunner, tmp_pa
     assert calls["ensure_download_dirs"] is True
 
 
-def test_cli_options_after_languages(monkeypatch, runner: CliRunner, tmp_path: Path) -> None:
+def test_cli_options_after_languages(monkeypatch, patched_main, runner: CliRunner) -> None:
     """Test that options can be placed after language arguments."""
-    config = _base_config(tmp_path)
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config)
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "/usr/bin/kindlegen")
-    monkeypatch.setattr(
-        "dictforge.main.make_defaults",
-        lambda *_: {
-            "title": "Title",
-            "shortname": "Short",
-            "outdir": str(tmp_path / "out"),
-            "in_code": "sr",
-            "out_code": "en",
-        },
-    )
-
     calls: dict[str, object] = {}
 
     class DummyBuilder:
@@ -183,7 +164,7 @@ def test_cli_options_after_languages(monkeypatch, runner: CliRunner, tmp_path: P
         def build_dictionary(self, **_: object) -> dict[str, int]:  # pragma: no cover - simple stub
             return {"Serbo-Croatian": 5}
 
-    monkeypatch.setattr("dictforge.main.Builder", DummyBuilder)
+    monkeypatch.setattr(main, "Builder", DummyBuilder)
 
     # Test: languages before options
     result1 = runner.invoke(cli, ["sr", "ru", "--reset-cache"])
@@ -207,21 +188,7 @@ def test_cli_options_after_languages(monkeypatch, runner: CliRunner, tmp_path: P
     assert calls["ensure_download_dirs"] is True
 
 
-def test_cli_download_error(monkeypatch, runner: CliRunner, tmp_path: Path) -> None:
-    config = _base_config(tmp_path)
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config)
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "/usr/bin/kindlegen")
-    monkeypatch.setattr(
-        "dictforge.main.make_defaults",
-        lambda *_: {
-            "title": "Title",
-            "shortname": "Short",
-            "outdir": str(tmp_path / "out"),
-            "in_code": "sr",
-            "out_code": "en",
-        },
-    )
-
+def test_cli_download_error(monkeypatch, patched_main, runner: CliRunner) -> None:
     class FailingBuilder:
         def __init__(
             self,
@@ -242,17 +209,15 @@ def test_cli_download_error(monkeypatch, runner: CliRunner, tmp_path: Path) -> N
         def build_dictionary(self, **_: object) -> None:
             raise KaikkiDownloadError("network down")
 
-    monkeypatch.setattr("dictforge.main.Builder", FailingBuilder)
+    monkeypatch.setattr(main, "Builder", FailingBuilder)
 
     result = runner.invoke(cli, ["sr"])
     assert result.exit_code == 1
     assert "network down" in result.output
 
 
-def test_cli_kindlegen_missing(monkeypatch, runner: CliRunner, tmp_path: Path) -> None:
-    config = _base_config(tmp_path)
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config)
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "")
+def test_cli_kindlegen_missing(monkeypatch, patched_main, runner: CliRunner) -> None:
+    monkeypatch.setattr(main, "guess_kindlegen_path", lambda: "")
 
     result = runner.invoke(cli, ["sr"])
     assert result.exit_code == 1
@@ -263,13 +228,13 @@ def test_cli_init_updates_config(monkeypatch, runner: CliRunner, tmp_path: Path)
     config = _base_config(tmp_path)
     saved: dict[str, object] = {}
 
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config.copy())
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "/detected/kindlegen")
+    monkeypatch.setattr(main, "load_config", lambda: config.copy())
+    monkeypatch.setattr(main, "guess_kindlegen_path", lambda: "/detected/kindlegen")
 
     def fake_save(data: dict[str, object]) -> None:
         saved.update(data)
 
-    monkeypatch.setattr("dictforge.main.save_config", fake_save)
+    monkeypatch.setattr(main, "save_config", fake_save)
 
     result = runner.invoke(cli, ["init"], input="Spanish\n\n")
     assert result.exit_code == 0
@@ -278,13 +243,13 @@ def test_cli_init_updates_config(monkeypatch, runner: CliRunner, tmp_path: Path)
     assert "Saved" in result.output
 
 
-def test_kindle_lang_override_accepts_supported(tmp_path: Path) -> None:
-    assert kindle_lang_code("sr", override="hr") == "hr"
-
-
-def test_kindle_lang_override_rejects_unsupported(tmp_path: Path) -> None:
-    with pytest.raises(KindleBuildError):
-        kindle_lang_code("sr", override="xx")
+@pytest.mark.parametrize(("override", "expected"), [("hr", "hr"), ("xx", None)])
+def test_kindle_lang_override(override: str, expected: str | None) -> None:
+    if expected is None:
+        with pytest.raises(KindleBuildError):
+            kindle_lang_code("sr", override=override)
+    else:
+        assert kindle_lang_code("sr", override=override) == expected
 
 
 def test_cli_init_hints_when_kindlegen_missing(
@@ -293,13 +258,13 @@ def test_cli_init_hints_when_kindlegen_missing(
     config = _base_config(tmp_path)
     saved: dict[str, object] = {}
 
-    monkeypatch.setattr("dictforge.main.load_config", lambda: config.copy())
-    monkeypatch.setattr("dictforge.main.guess_kindlegen_path", lambda: "")
+    monkeypatch.setattr(main, "load_config", lambda: config.copy())
+    monkeypatch.setattr(main, "guess_kindlegen_path", lambda: "")
 
     def fake_save(data: dict[str, object]) -> None:
         saved.update(data)
 
-    monkeypatch.setattr("dictforge.main.save_config", fake_save)
+    monkeypatch.setattr(main, "save_config", fake_save)
 
     path_input = str(tmp_path / "Kindle Previewer" / "kindlegen")
     result = runner.invoke(cli, ["init"], input=f"\n{path_input}\n")
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 from rich.console import Console
 
+from dictforge import progress_bar
 from dictforge.progress_bar import (
     _BaseProgressCapture,
     _DatabaseProgressCapture,
@@ -62,6 +63,75 @@ class TestBaseProgressCaptureHandleLine:
         assert capture.warnings == ["   "]
 
 
+class TestBaseProgressCaptureAdvanceTo:
+    """Test advance_to() in _BaseProgressCapture."""
+
+    def test_advance_to_coalesces_dense_updates(self, mock_console: Console, monkeypatch) -> None:
+        monkeypatch.setattr(progress_bar, "monotonic", lambda: 1000.0)  # frozen clock
+        capture = _BaseProgressCapture(
+            console=mock_console,
+            enabled=False,
+            description="Test",
+            unit="items",
+            total_hint=100,
+        )
+        capture._progress = MagicMock()
+        capture._task_id = 1
+        capture._active = True
+        for value in range(1, 51):
+            capture.advance_to(value)
+        assert capture._current == 50
+        assert capture._progress.update.call_count == 1
+
+        capture.advance_to(100)
+        assert capture._progress.update.call_count == 2
+        capture._progress.update.assert_called_with(1, completed=100)
+
+    def test_throttled_value_is_flushed_on_phase_change_and_stop(
+        self, mock_console: Console, monkeypatch
+    ) -> None:
+        # With a frozen clock only the first advance is shown immediately.
+        monkeypatch.setattr(progress_bar, "monotonic", lambda: 1000.0)
+        capture = _BaseProgressCapture(
+            console=mock_console,
+            enabled=False,
+            description="Test",
+            unit="items",
+            total_hint=100,
+        )
+        progress = MagicMock()
+        capture._progress = progress
+        capture._task_id = 1
+        capture._active = True
+        capture.advance_to(10)
+        capture.advance_to(20)
+        progress.update.assert_called_with(1, completed=10)
+
+        capture.set_description("Next phase")
+        assert progress.update.call_args_list[-2].kwargs == {"completed": 20}
+
+        capture.advance_to(30)
+        capture.stop()
+        progress.update.assert_called_with(1, completed=30)
+        progress.__exit__.assert_called_once()
+
+
+class TestBaseProgressCaptureWrite:
+    """Test write()/writelines() line splitting in _BaseProgressCapture."""
+
+    def test_writelines_dispatches_complete_lines(self, mock_console: Console) -> None:
+        capture = _KindleProgressCapture(
+            console=mock_console,
+            enabled=False,
+            total_hint=None,
+        )
+        capture.writelines(["10", "0 words\n", "\n", "unknown", " message\n", "tail"])
+        assert capture._current == 100
+        assert capture.warnings == ["unknown message"]
+        assert capture.output() == "100 words\n\nunknown message\ntail"
+        assert capture.warnings == ["unknown message", "tail"]
+
+
 class TestDatabaseProgressCaptureHandleLine:
     """Test handle_line() in _DatabaseProgressCapture."""
 
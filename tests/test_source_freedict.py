@@ -1,12 +1,16 @@
 """Unit tests for FreeDict dictionary source."""
 
 import gzip
+import io
+import json
 import struct
+import tarfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
+from dictforge import source_freedict
 from dictforge.source_freedict import (
     FreeDictSource,
     FreeDictParseError,
@@ -187,6 +191,18 @@ def test_read_definitions_plain(freedict_source: FreeDictSource, tmp_path: Path)
     assert definitions["word2"] == "definition2 longer"
 
 
+def test_read_definitions_replaces_invalid_utf8(
+    freedict_source: FreeDictSource, tmp_path: Path
+) -> None:
+    """Undecodable bytes show up as replacement characters instead of being dropped."""
+    dict_path = tmp_path / "test.dict"
+    dict_path.write_bytes(b"caf\xe9 ")
+
+    definitions = freedict_source._read_definitions(dict_path, [("word", 0, 5)])
+
+    assert definitions["word"] == "caf\ufffd"
+
+
 def test_read_definitions_compressed(freedict_source: FreeDictSource, tmp_path: Path) -> None:
     """Test reading definitions from compressed .dict.dz file."""
     dict_path = tmp_path / "test.dict.dz"
@@ -206,6 +222,32 @@ def test_read_definitions_compressed(freedict_source: FreeDictSource, tmp_path:
     assert definitions["word2"] == "definition2 longer"
 
 
+def test_read_definitions_out_of_order_and_shared(
+    freedict_source: FreeDictSource, tmp_path: Path
+) -> None:
+    """Index order is kept even though records are read in offset order."""
+    dict_path = tmp_path / "test.dict.dz"
+    with gzip.open(dict_path, "wb") as f:
+        f.write(b"firstsecond")
+
+    index = [
+        ("second", 5, 6),
+        ("first", 0, 5),
+        ("2nd", 5, 6),
+        ("empty", 11, 0),
+        ("beyond", 8, 10),
+    ]
+
+    definitions = freedict_source._read_definitions(dict_path, index)
+
+    assert list(definitions.items()) == [
+        ("second", "second"),
+        ("first", "first"),
+        ("2nd", "second"),
+        ("empty", ""),
+    ]
+
+
 def test_extract_glosses_simple(freedict_source: FreeDictSource) -> None:
     """Test extracting glosses from simple text."""
     glosses = freedict_source._extract_glosses("hello; world")
@@ -226,6 +268,10 @@ def test_extract_glosses_with_html(freedict_source: FreeDictSource) -> None:
     glosses = freedict_source._extract_glosses("<p>definition</p>")
     assert glosses == ["definition"]
 
+    # Empty and unterminated brackets are not tags
+    assert freedict_source._extract_glosses("a <> b <c") == ["a <> b <c"]
+    assert freedict_source._extract_glosses("<<b>x</b>") == ["x"]
+
 
 def test_convert_to_kaikki_format(freedict_source: FreeDictSource) -> None:
     """Test conversion of StarDict entry to Kaikki format."""
@@ -403,6 +449,164 @@ def test_get_entries_creates_cache_structure(
     assert (freedict_root / "filtered").exists()
 
 
+def test_try_chained_translation_writes_each_entry_once(
+    freedict_source: FreeDictSource, tmp_path: Path
+) -> None:
+    """Chained entries are streamed to the cache, one line per matched word."""
+    freedict_source.ensure_download_dirs()
+    pairs = {
+        ("Serbian", "English"): [
+            {"word": "zdravo", "senses": [{"glosses": ["hello", "hi"]}]},
+            {"word": "nepoznato", "senses": [{"glosses": ["unknown"]}]},
+        ],
+        ("English", "Russian"): [
+            {"word": "hello", "senses": [{"glosses": ["привет"]}]},
+            {"word": "hi", "senses": [{"glosses": "здравствуй"}]},
+        ],
+    }
+    freedict_source._fetch_and_parse_dict = MagicMock(
+        side_effect=lambda in_lang, out_lang, *codes: pairs[in_lang, out_lang]
+    )
+
+    cached_path = freedict_source._try_chained_translation("Serbian", "Russian")
+
+    assert cached_path == tmp_path / "freedict" / "filtered" / "Serbian__Russian__chained.jsonl"
+    with cached_path.open("rb") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    assert entries == [
+        {
+            "word": "zdravo",
+            "pos": "noun",
+            "senses": [
+                {"glosses": ["здравствуй", "привет"], "raw_glosses": ["здравствуй", "привет"]},
+            ],
+        },
+    ]
+    assert not list(cached_path.parent.glob("*.part"))
+
+
+def _stardict_tar_xz() -> bytes:
+    """Build an in-memory FreeDict-style .tar.xz archive with one StarDict entry."""
+    definition = b"greeting"
+    files = {
+        "test/test.ifo": b"wordcount=1\n",
+        "test/test.idx": b"hello\x00" + struct.pack(">II", 0, len(definition)),
+        "test/test.dict.dz": gzip.compress(definition),
+    }
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:xz") as tar:
+        for name, payload in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(payload)
+            tar.addfile(info, io.BytesIO(payload))
+    return buffer.getvalue()
+
+
+def _archive_session(raw: io.BytesIO) -> MagicMock:
+    """Session mock serving a version listing, a file listing and then ``raw``."""
+    session = MagicMock()
+    session.get.side_effect = [
+        MagicMock(status_code=200, text='href="0.2/"'),
+        MagicMock(status_code=200, text='href="freedict-srp-eng-0.2.stardict.tar.xz"'),
+        MagicMock(raw=raw),
+    ]
+    return session
+
+
+def test_download_dictionary_extracts_archive(tmp_path: Path) -> None:
+    """Archives are extracted while they download and kept in the downloads cache."""
+    archive = _stardict_tar_xz()
+    source = FreeDictSource(
+        cache_dir=tmp_path,
+        session=_archive_session(io.BytesIO(archive)),
+        progress_factory=MagicMock(),
+    )
+    source.ensure_download_dirs()
+
+    stardict_dir = source._download_dictionary("srp-eng")
+
+    assert stardict_dir == tmp_path / "freedict" / "srp-eng" / "0.2" / "test"
+    assert source._parse_stardict_files(stardict_dir)[0]["word"] == "hello"
+    archive_path = tmp_path / "freedict" / "downloads" / "srp-eng-0.2.tar.xz"
+    assert archive_path.read_bytes() == archive
+    assert not list((tmp_path / "freedict").rglob("*.part"))
+
+
+def test_download_dictionary_interrupted_leaves_no_partial_cache(tmp_path: Path) -> None:
+    """A download that dies mid-stream leaves neither an archive nor a version directory."""
+
+    class CutStream(io.BytesIO):
+        def read(self, size: int | None = -1) -> bytes:
+            if self.tell() > 0:
+                raise KeyboardInterrupt
+            return super().read(64)
+
+    source = FreeDictSource(
+        cache_dir=tmp_path,
+        session=_archive_session(CutStream(_stardict_tar_xz())),
+        progress_factory=MagicMock(),
+    )
+    source.ensure_download_dirs()
+
+    with pytest.raises(KeyboardInterrupt):
+        source._download_dictionary("srp-eng")
+
+    assert not list((tmp_path / "freedict" / "srp-eng").iterdir())
+    assert not list((tmp_path / "freedict" / "downloads").iterdir())
+
+
+@pytest.mark.parametrize("tar_bin", ["tar", None])
+def test_extract_archive_with_or_without_system_tar(
+    freedict_source: FreeDictSource,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    tar_bin: str | None,
+) -> None:
+    """On-disk archives extract the same through system tar and the tarfile fallback."""
+    if tar_bin is None:
+        monkeypatch.setattr("dictforge.source_freedict.shutil.which", lambda _: None)
+    archive_path = tmp_path / "dict.tar.xz"
+    archive_path.write_bytes(_stardict_tar_xz())
+    extract_dir = tmp_path / "out"
+    extract_dir.mkdir()
+
+    freedict_source._extract_archive(archive_path, extract_dir)
+
+    assert (extract_dir / "test" / "test.idx").exists()
+
+
+def test_extract_archive_fallback_discards_partial_tar_output(
+    freedict_source: FreeDictSource,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """When system tar fails midway, tarfile starts over from an empty directory."""
+
+    def failing_tar(args: list[str], **_: object) -> MagicMock:
+        target = Path(args[-1])
+        (target / "test").mkdir()
+        (target / "test" / "test.dict.dz").write_bytes(b"truncated")
+        (target / "stray.txt").write_bytes(b"partial")
+        return MagicMock(returncode=2)
+
+    monkeypatch.setattr("dictforge.source_freedict.shutil.which", lambda _: "tar")
+    monkeypatch.setattr("dictforge.source_freedict.subprocess.run", failing_tar)
+    archive_path = tmp_path / "dict.tar.xz"
+    archive_path.write_bytes(_stardict_tar_xz())
+    extract_dir = tmp_path / "out"
+
+    freedict_source._extract_archive(archive_path, extract_dir)
+
+    assert sorted(p.name for p in extract_dir.rglob("*")) == [
+        "test",
+        "test.dict.dz",
+        "test.idx",
+        "test.ifo",
+    ]
+    assert (extract_dir / "test" / "test.dict.dz").read_bytes() != b"truncated"
+    assert not list(tmp_path.glob(".out*"))
+
+
 def test_find_latest_version_success(freedict_source: FreeDictSource) -> None:
     """Test finding latest version when version exists."""
     # Mock successful response for version 0.2
@@ -451,6 +655,44 @@ def test_transliteration_applied_in_fetch_and_parse(
     assert entries[0]["word"] == "zdravo"
     assert "pozdrav" in entries[0]["senses"][0]["glosses"][0]
 
+    # The converted entries are cached, so a second run skips StarDict parsing
+    freedict_source._iter_stardict_entries = MagicMock(side_effect=AssertionError)
+    assert freedict_source._fetch_and_parse_dict("Serbian", "English", "srp", "eng") == entries
+
+    # Changed StarDict files invalidate the cache
+    (dict_dir / "test.ifo").write_text("wordcount=1\nversion=2\n", encoding="utf-8")
+    with pytest.raises(AssertionError):
+        freedict_source._fetch_and_parse_dict("Serbian", "English", "srp", "eng")
+
+
+def test_parsed_cache_path_tracks_conversion_version(tmp_path: Path, monkeypatch) -> None:
+    """Bumping PARSED_CACHE_VERSION retires entries converted by older code."""
+    (tmp_path / "test.ifo").write_text("wordcount=1\n", encoding="utf-8")
+    before = FreeDictSource._parsed_cache_path(tmp_path, "Serbian")
+    assert FreeDictSource._parsed_cache_path(tmp_path, "Serbian") == before
+
+    monkeypatch.setattr(
+        source_freedict, "PARSED_CACHE_VERSION", source_freedict.PARSED_CACHE_VERSION + 1
+    )
+
+    assert FreeDictSource._parsed_cache_path(tmp_path, "Serbian") != before
+
+
+def test_write_parsed_cache_only_retires_older_versions(tmp_path: Path) -> None:
+    """Caches of the current version, e.g. for another language, survive a cache write."""
+    (tmp_path / "test.ifo").write_text("wordcount=1\n", encoding="utf-8")
+    other_language = FreeDictSource._parsed_cache_path(tmp_path, "Croatian")
+    other_language.write_text("{}\n", encoding="utf-8")
+    older_version = tmp_path / f"{source_freedict.PARSED_CACHE_PREFIX}0123456789abcdef.jsonl"
+    older_version.write_text("{}\n", encoding="utf-8")
+    cache_path = FreeDictSource._parsed_cache_path(tmp_path, "Serbian")
+
+    FreeDictSource._write_parsed_cache([{"word": "zdravo"}], cache_path)
+
+    assert list(FreeDictSource._read_parsed_cache(cache_path)) == [{"word": "zdravo"}]
+    assert other_language.exists()
+    assert not older_version.exists()
+
 
 def test_cyrillic_to_latin_mapping_complete(freedict_source: FreeDictSource) -> None:
     """Test that all Serbian Cyrillic letters are mapped."""